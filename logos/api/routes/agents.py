@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 from uuid import uuid4
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 
 from logos.core.pipeline_executor import PipelineContext, run_pipeline
@@ -51,15 +51,31 @@ def _build_feedback_bundle(
     return bundle
 
 
-def _persist_feedback(bundle: FeedbackBundle) -> None:
+def get_pipeline_runner() -> Callable[..., Any]:
+    """Dependency provider for the pipeline executor used by agent queries."""
+
+    return run_pipeline
+
+
+def get_feedback_writer() -> Callable[[FeedbackBundle], Any]:
+    """Dependency provider for persisting agent feedback bundles."""
+
+    return append_feedback
+
+
+def _persist_feedback(bundle: FeedbackBundle, write: Callable[[FeedbackBundle], Any]) -> None:
     try:
-        append_feedback(bundle)
+        write(bundle)
     except Exception:  # pragma: no cover - avoid failing API responses
         logger.exception("agent_feedback_persist_failed", extra={"interaction_id": bundle.meta.interaction_id})
 
 
 @router.post("/agent/query")
-async def query_agent(payload: AgentQueryRequest) -> dict[str, Any]:
+async def query_agent(
+    payload: AgentQueryRequest,
+    pipeline_runner: Callable[..., Any] = Depends(get_pipeline_runner),
+    write_feedback: Callable[[FeedbackBundle], Any] = Depends(get_feedback_writer),
+) -> dict[str, Any]:
     request_id = uuid4().hex
     context = payload.context or {}
     input_bundle = {
@@ -74,7 +90,7 @@ async def query_agent(payload: AgentQueryRequest) -> dict[str, Any]:
         context_data={"person_id": payload.person_id, "context": context},
     )
 
-    result = run_pipeline("pipeline.agent_dialogue", input_bundle, ctx)
+    result = pipeline_runner("pipeline.agent_dialogue", input_bundle, ctx)
     agent_response = result.get("agent_response") if isinstance(result, Mapping) else None
     reasoning = result.get("reasoning", []) if isinstance(result, Mapping) else []
     feedback_bundle = _build_feedback_bundle(
@@ -85,7 +101,7 @@ async def query_agent(payload: AgentQueryRequest) -> dict[str, Any]:
         agent_response=agent_response,
         context=context,
     )
-    _persist_feedback(feedback_bundle)
+    _persist_feedback(feedback_bundle, write_feedback)
 
     response: dict[str, Any] = {
         "agent_response": agent_response,
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from math import ceil
+from typing import Any, Callable
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
@@ -22,13 +23,25 @@ class AlertOutcomeUpdate(BaseModel):
     status: str
 
 
-def _run_reasoning_alerts() -> None:
+def _run_reasoning_alerts(pipeline_runner: Callable[..., Any]) -> None:
     context = PipelineContext(
         context_data={
             "graph_client_factory": get_client,
         }
     )
-    run_pipeline("pipeline.reasoning_alerts", {}, context)
+    pipeline_runner("pipeline.reasoning_alerts", {}, context)
+
+
+def get_pipeline_runner() -> Callable[..., Any]:
+    """Dependency provider for the pipeline executor used by the reasoning pass."""
+
+    return run_pipeline
+
+
+def get_list_alerts_fn() -> Callable[..., tuple[list[dict[str, Any]], int]]:
+    """Dependency provider for the alert listing query."""
+
+    return graph_queries.list_alerts
 
 
 def _parse_filters(raw_filters: list[str] | None) -> list[str]:
@@ -49,12 +62,14 @@ async def list_alerts(
     org_id: str | None = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=200),
+    pipeline_runner: Callable[..., Any] = Depends(get_pipeline_runner),
+    fetch_alerts: Callable[..., tuple[list[dict[str, Any]], int]] = Depends(get_list_alerts_fn),
 ) -> dict[str, object]:
     types = _parse_filters(type_filters)
     statuses = _parse_filters(status_filters)
     try:
-        _run_reasoning_alerts()
-        items, total = graph_queries.list_alerts(
+        _run_reasoning_alerts(pipeline_runner)
+        items, total = fetch_alerts(
             types=types or None,
             statuses=statuses or None,
             project_id=project_id,
@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from datetime import datetime, timezone
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import JSONResponse
 
 from logos import app_state
@@ -21,6 +21,12 @@ router = APIRouter()
 legacy_router = APIRouter()
 
 
+def get_graph_client_factory() -> Callable[[], Any]:
+    """Dependency provider for the graph client factory used by the commit pipeline."""
+
+    return get_client
+
+
 def _preview_payload(preview: PreviewBundle | Mapping[str, Any]) -> dict[str, Any]:
     if isinstance(preview, PreviewBundle):
         return preview.model_dump(mode="json")
@@ -101,7 +107,9 @@ def _build_feedback_bundle(
 
 @router.post("/interactions/{interaction_id}/commit")
 async def commit_interaction_api(
-    interaction_id: str, edited_preview: PreviewBundle
+    interaction_id: str,
+    edited_preview: PreviewBundle,
+    graph_client_factory: Callable[[], Any] = Depends(get_graph_client_factory),
 ) -> dict[str, object]:
     if edited_preview.meta.interaction_id != interaction_id:
         raise HTTPException(status_code=400, detail="interaction_id_mismatch")
@@ -125,7 +133,7 @@ async def commit_interaction_api(
         user_id="api",
         context_data={
             "interaction_id": interaction_id,
-            "graph_client_factory": get_client,
+            "graph_client_factory": graph_client_factory,
             "commit_time": datetime.now(timezone.utc),
             "graph_update_builder": build_graph_update_event,
             "feedback_bundle": feedback_bundle,
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Query
+from typing import Any, Callable
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
 
 from ...graphio import queries as graph_queries
@@ -11,12 +13,20 @@ from ...graphio.neo4j_client import GraphUnavailable
 router = APIRouter()
 
 
+def get_project_map_builder() -> Callable[..., dict[str, Any] | None]:
+    """Dependency provider for the project map view query."""
+
+    return graph_queries.build_project_map_view
+
+
 @router.get("/projects/{project_id}/map")
 async def project_map_view(
-    project_id: str, include_graph: bool = Query(True)
+    project_id: str,
+    include_graph: bool = Query(True),
+    build_view: Callable[..., dict[str, Any] | None] = Depends(get_project_map_builder),
 ) -> dict[str, object]:
     try:
-        payload = graph_queries.build_project_map_view(
+        payload = build_view(
             project_id=project_id, include_graph=include_graph
         )
     except GraphUnavailable:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Query
+from typing import Any, Callable
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
 
 from ...graphio.neo4j_client import GraphUnavailable
@@ -11,15 +13,22 @@ from ...graphio import queries as graph_queries
 router = APIRouter()
 
 
+def get_stakeholder_view_builder() -> Callable[..., dict[str, Any] | None]:
+    """Dependency provider for the stakeholder 360 view query."""
+
+    return graph_queries.build_stakeholder_view
+
+
 @router.get("/stakeholders/{stakeholder_id}")
 async def stakeholder_view(
     stakeholder_id: str,
     from_date: str | None = Query(None, alias="from"),
     to_date: str | None = Query(None, alias="to"),
     include_graph: bool = Query(False),
+    build_view: Callable[..., dict[str, Any] | None] = Depends(get_stakeholder_view_builder),
 ) -> dict[str, object]:
     try:
-        payload = graph_queries.build_stakeholder_view(
+        payload = build_view(
             stakeholder_id=stakeholder_id,
             from_date=from_date,
             to_date=to_date,
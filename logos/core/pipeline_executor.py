@@ -29,6 +29,7 @@ from logos.models.bundles import (
 )
 from logos.staging.store import StagingStore
 from logos.workflows import stages as legacy_stages
+from logos.yaml_cache import load_yaml_cached
 
 DEFAULT_PIPELINE_PATH = Path(__file__).resolve().parent.parent / "knowledgebase" / "pipelines.yml"
 
@@ -114,7 +115,7 @@ class PipelineLoader:
             raise PipelineConfigError(f"Pipeline registry missing at {self.path}")
 
         try:
-            raw = yaml.safe_load(self.path.read_text(encoding="utf-8")) or {}
+            raw = load_yaml_cached(self.path) or {}
         except yaml.YAMLError as exc:  # pragma: no cover - defensive guard
             raise PipelineConfigError("Failed to parse pipeline registry YAML") from exc
 
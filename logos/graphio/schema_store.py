@@ -107,6 +107,34 @@ class RelationshipTypeDefinition:
         }
 
 
+def _parse_node_types(raw: Mapping[str, Any]) -> dict[str, NodeTypeDefinition]:
+    entries = raw.get("node_types") if isinstance(raw.get("node_types"), Mapping) else raw
+    node_types: dict[str, NodeTypeDefinition] = {}
+    if isinstance(entries, Mapping):
+        for label, definition in entries.items():
+            if not isinstance(definition, Mapping):
+                continue
+            node_types[str(label)] = NodeTypeDefinition.from_mapping(definition)
+    return node_types
+
+
+def _parse_relationship_types(raw: Mapping[str, Any]) -> dict[str, RelationshipTypeDefinition]:
+    entries = raw.get("relationship_types") if isinstance(raw.get("relationship_types"), Mapping) else raw
+    rel_types: dict[str, RelationshipTypeDefinition] = {}
+    if isinstance(entries, Mapping):
+        for rel, definition in entries.items():
+            if not isinstance(definition, Mapping):
+                continue
+            rel_types[str(rel)] = RelationshipTypeDefinition.from_mapping(definition)
+    return rel_types
+
+
+def _parse_version(info: Any) -> dict[str, Any]:
+    if not isinstance(info, Mapping):
+        return {"version": 1, "last_updated": None}
+    return {"version": info.get("version", 1), "last_updated": info.get("last_updated")}
+
+
 class SchemaStore:
     """Read/write store for node and relationship type definitions."""
 
@@ -148,39 +176,50 @@ class SchemaStore:
             return default
         return str(value)
 
+    @classmethod
+    def from_mapping(
+        cls,
+        node_types: Mapping[str, Any] | None = None,
+        relationship_types: Mapping[str, Any] | None = None,
+        rules: Mapping[str, Any] | None = None,
+        version: Mapping[str, Any] | None = None,
+        *,
+        mutable: bool = False,
+        node_types_path: Path = NODE_TYPES_PATH,
+        relationship_types_path: Path = RELATIONSHIP_TYPES_PATH,
+        version_path: Path = VERSION_PATH,
+    ) -> "SchemaStore":
+        """Build a store from in-memory payloads without parsing YAML.
+
+        By default later updates change only this in-memory store and are
+        never written to disk; a mutable store persists them to the given
+        paths exactly as a disk-loaded store would.
+        """
+
+        store = cls.__new__(cls)
+        store._node_types_path = node_types_path
+        store._relationship_types_path = relationship_types_path
+        store._rules_path = RULES_PATH
+        store._version_path = version_path
+        store._mutable = mutable
+        store._node_types = _parse_node_types(node_types or {})
+        store._relationship_types = _parse_relationship_types(relationship_types or {})
+        store._rules = rules if isinstance(rules, Mapping) else {}
+        store._version_info = _parse_version(version or {})
+        return store
+
     def _load_node_types(self) -> dict[str, NodeTypeDefinition]:
-        raw = _load_yaml(self._node_types_path)
-        entries = raw.get("node_types") if isinstance(raw.get("node_types"), Mapping) else raw
-        node_types: dict[str, NodeTypeDefinition] = {}
-        if isinstance(entries, Mapping):
-            for label, definition in entries.items():
-                if not isinstance(definition, Mapping):
-                    continue
-                node_types[str(label)] = NodeTypeDefinition.from_mapping(definition)
-        return node_types
+        return _parse_node_types(_load_yaml(self._node_types_path))
 
     def _load_relationship_types(self) -> dict[str, RelationshipTypeDefinition]:
-        raw = _load_yaml(self._relationship_types_path)
-        entries = (
-            raw.get("relationship_types") if isinstance(raw.get("relationship_types"), Mapping) else raw
-        )
-        rel_types: dict[str, RelationshipTypeDefinition] = {}
-        if isinstance(entries, Mapping):
-            for rel, definition in entries.items():
-                if not isinstance(definition, Mapping):
-                    continue
-                rel_types[str(rel)] = RelationshipTypeDefinition.from_mapping(definition)
-        return rel_types
+        return _parse_relationship_types(_load_yaml(self._relationship_types_path))
 
     def _load_rules(self) -> Mapping[str, Any]:
         rules = _load_yaml(self._rules_path)
         return rules if isinstance(rules, Mapping) else {}
 
     def _load_version(self) -> dict[str, Any]:
-        info = _load_yaml(self._version_path)
-        if not isinstance(info, Mapping):
-            return {"version": 1, "last_updated": None}
-        return {"version": info.get("version", 1), "last_updated": info.get("last_updated")}
+        return _parse_version(_load_yaml(self._version_path))
 
     def _persist_node_types(self) -> None:
         if not self._mutable:
@@ -9,7 +9,7 @@ from typing import Any, Dict
 import pathlib
 
 from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 
@@ -34,7 +34,7 @@ from .interfaces.local_asr_stub import TranscriptionFailure, transcribe
 from .models.bundles import InteractionMeta, PreviewBundle, RawInputBundle
 from .services.sync import update_broadcaster
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 templates = Jinja2Templates(
     directory=str(pathlib.Path(__file__).resolve().parent / "templates")
 )
@@ -8,6 +8,8 @@ import logging
 
 import yaml
 
+from logos.yaml_cache import YAML_LOADER, file_signature
+
 TIERS_PATH = Path(__file__).resolve().parent / "knowledgebase" / "models" / "tiers.yml"
 MODEL_CONFIG_PATH = Path(__file__).resolve().parent / "knowledgebase" / "models" / "catalog.yml"
 _ALLOWED_TIERS = {"rule_only", "local_ml", "local_llm"}
@@ -50,15 +52,19 @@ class ModelConfigError(RuntimeError):
     """Raised when a model configuration file is missing or malformed."""
 
 
-@lru_cache(maxsize=4)
 def _load_tier_map(path: str) -> Dict[str, TaskTierConfig]:
     tiers_path = Path(path)
     if not tiers_path.exists():
         raise TierConfigError(f"Model tier config missing at {tiers_path}")
+    return _parse_tier_map(path, *file_signature(tiers_path))
+
+
+@lru_cache(maxsize=4)
+def _parse_tier_map(path: str, mtime_ns: int, size: int, inode: int) -> Dict[str, TaskTierConfig]:
+    """Parse and validate a tier file; the stat fields key the cache so edits are picked up."""
 
     try:
-        with tiers_path.open("r", encoding="utf-8") as file:
-            raw = yaml.safe_load(file) or {}
+        raw = yaml.load(Path(path).read_bytes(), Loader=YAML_LOADER) or {}
     except yaml.YAMLError as exc:  # pragma: no cover - defensive branch
         raise TierConfigError("Failed to parse model tier YAML") from exc
 
@@ -109,7 +115,7 @@ def get_task_tier(task: str, path: Path | None = None) -> TaskTierConfig:
 def clear_tier_cache() -> None:
     """Clear cached tier maps, primarily for testing overrides."""
 
-    _load_tier_map.cache_clear()
+    _parse_tier_map.cache_clear()
 
 
 def _parse_model_definition(entry: Any, *, context: str) -> ModelDefinition:
@@ -132,15 +138,21 @@ def _parse_model_definition(entry: Any, *, context: str) -> ModelDefinition:
     return ModelDefinition(name=name, parameters=dict(parameters))
 
 
-@lru_cache(maxsize=4)
 def _load_model_catalog(path: str) -> tuple[Dict[str, ModelDefinition], Dict[str, Dict[str, ModelDefinition]]]:
     catalog_path = Path(path)
     if not catalog_path.exists():
         raise ModelConfigError(f"Model config missing at {catalog_path}")
+    return _parse_model_catalog(path, *file_signature(catalog_path))
+
+
+@lru_cache(maxsize=4)
+def _parse_model_catalog(
+    path: str, mtime_ns: int, size: int, inode: int
+) -> tuple[Dict[str, ModelDefinition], Dict[str, Dict[str, ModelDefinition]]]:
+    """Parse and validate a model catalog; the stat fields key the cache so edits are picked up."""
 
     try:
-        with catalog_path.open("r", encoding="utf-8") as file:
-            raw = yaml.safe_load(file) or {}
+        raw = yaml.load(Path(path).read_bytes(), Loader=YAML_LOADER) or {}
     except yaml.YAMLError as exc:  # pragma: no cover - defensive branch
         raise ModelConfigError("Failed to parse model config YAML") from exc
 
@@ -228,7 +240,7 @@ def get_model_for(
 def clear_model_cache() -> None:
     """Clear cached model configurations, primarily for testing overrides."""
 
-    _load_model_catalog.cache_clear()
+    _parse_model_catalog.cache_clear()
 
 
 __all__ = [
@@ -14,6 +14,7 @@ from jinja2 import Template, TemplateError
 from logos.interfaces.ollama_client import OllamaError, call_llm
 from logos.model_tiers import TierConfigError, get_task_tier
 from logos.knowledgebase import KnowledgebaseStore, KnowledgebaseWriteError
+from logos.yaml_cache import YAML_LOADER, load_yaml_cached
 
 PROMPT_PATH = Path(__file__).resolve().parent.parent / "knowledgebase" / "prompts" / "extraction_interaction.yml"
 DOMAIN_PROFILES_DIR = Path(__file__).resolve().parent.parent / "knowledgebase" / "domain_profiles"
@@ -39,7 +40,7 @@ def _load_yaml(path: Path) -> Any:
         return {}
 
     with path.open("r", encoding="utf-8") as file:
-        return yaml.safe_load(file) or {}
+        return yaml.load(file, Loader=YAML_LOADER) or {}
 
 
 def _to_snake(text: str) -> str:
@@ -51,19 +52,20 @@ def _schema_entity_keys(schema_path: Path | None = None) -> List[str]:
     """Return pluralised entity keys derived from the schema node types."""
 
     path = schema_path or SCHEMA_NODE_TYPES_PATH
-    data = _load_yaml(path)
+    if not path.exists():
+        return []
+    data = load_yaml_cached(path) or {}
     node_types = data.get("node_types") if isinstance(data, Mapping) else {}
-    keys: List[str] = []
+    keys: set[str] = set()
 
     if isinstance(node_types, Mapping):
         for label in node_types.keys():
             if not isinstance(label, str):
                 continue
             snake = _to_snake(label)
-            plural = snake if snake.endswith("s") else f"{snake}s"
-            keys.append(plural)
+            keys.add(snake if snake.endswith("s") else f"{snake}s")
 
-    return sorted(set(keys))
+    return sorted(keys)
 
 
 def _blank_entity_map(schema_path: Path | None = None) -> Dict[str, list]:
@@ -141,7 +143,7 @@ def _load_obligation_patterns(lexicon_path: Path | None = None) -> List[re.Patte
 
     try:
         with path.open("r", encoding="utf-8") as file:
-            data = yaml.safe_load(file) or {}
+            data = yaml.load(file, Loader=YAML_LOADER) or {}
     except yaml.YAMLError as exc:  # pragma: no cover - yaml parser error handling
         raise LexiconConfigError("Failed to parse obligation lexicon YAML") from exc
 
@@ -247,7 +249,7 @@ def _load_extraction_prompt(prompt_path: Path | None = None) -> Dict[str, Any]:
 
     try:
         with path.open("r", encoding="utf-8") as file:
-            data = yaml.safe_load(file) or {}
+            data = yaml.load(file, Loader=YAML_LOADER) or {}
     except yaml.YAMLError as exc:  # pragma: no cover - yaml parser error handling
         raise PromptConfigError("Failed to parse extraction prompt YAML") from exc
 
@@ -7,6 +7,7 @@ from typing import Any, Dict, Iterable, Mapping, Sequence
 import yaml
 
 from logos.graphio.upsert import GraphNode, GraphRelationship, InteractionBundle
+from logos.yaml_cache import YAML_LOADER, load_yaml_cached
 
 RELATIONSHIP_TYPES_PATH = (
     Path(__file__).resolve().parent.parent / "knowledgebase" / "schema" / "relationship_types.yml"
@@ -45,18 +46,18 @@ def _parse_datetime(value: str | datetime | None) -> datetime | None:
 
 
 _REASONING_REL_TYPES = {"RESULT_OF", "RELATED_TO", "INFLUENCES"}
+_REL_SEPARATORS = str.maketrans({"-": "_", " ": "_"})
 
 
 def _normalise_rel_key(rel: str) -> str:
-    return rel.replace("-", "_").replace(" ", "_").upper()
+    return rel.translate(_REL_SEPARATORS).upper()
 
 
 def _load_relationship_mappings(path: Path = RELATIONSHIP_TYPES_PATH) -> dict[str, str]:
     if not path.exists():
         return {}
 
-    with path.open("r", encoding="utf-8") as file:
-        data = yaml.safe_load(file) or {}
+    data = load_yaml_cached(path) or {}
 
     entries = data.get("relationship_types") if isinstance(data.get("relationship_types"), Mapping) else data
     mapping: dict[str, str] = {}
@@ -67,7 +68,7 @@ def _load_relationship_mappings(path: Path = RELATIONSHIP_TYPES_PATH) -> dict[st
         if not rel_type:
             continue
         canonical = _normalise_rel_key(str(rel_type))
-        mapping[_normalise_rel_key(str(rel_type))] = canonical
+        mapping[canonical] = canonical
         if isinstance(definition, Mapping):
             aliases = definition.get("aliases") if isinstance(definition.get("aliases"), (list, tuple, set)) else []
             for alias in aliases:
@@ -144,7 +145,7 @@ def _load_inference_rules(path: Path = INFERENCE_RULES_PATH) -> Mapping[str, Any
     if not path.exists():
         return {}
     with path.open("r", encoding="utf-8") as file:
-        data = yaml.safe_load(file) or {}
+        data = yaml.load(file, Loader=YAML_LOADER) or {}
     return data if isinstance(data, Mapping) else {}
 
 
@@ -139,20 +139,19 @@ class EmbeddingService:
                 continue
             payload.sort(key=lambda item: item[0])
             vectors = self._text_backend.embed([item[2] for item in payload])
+            rows: list[dict[str, Any]] = []
             for (node_id, props, _), vector in zip(payload, vectors, strict=False):
                 content_hash = hash_text_content(_select_text_fields(props))
-                if self._upsert_embedding(
-                    label=label,
-                    node_id=node_id,
-                    props=props,
-                    embedding_field="embedding_text",
-                    embedding=vector,
-                    model_name=self._text_backend.model_name,
-                    model_version=self._text_backend.model_name,
-                    content_hash=content_hash,
-                    now=now,
-                ):
-                    updated += 1
+                if _needs_embedding(props, "embedding_text", content_hash):
+                    rows.append({"id": node_id, "embedding": vector, "content_hash": content_hash})
+            updated += self._write_embeddings(
+                label=label,
+                embedding_field="embedding_text",
+                rows=rows,
+                model_name=self._text_backend.model_name,
+                model_version=self._text_backend.model_name,
+                now=now,
+            )
         return updated
 
     def _refresh_concept_graph_embeddings(self, *, now: datetime, concept_label: str, seed: int) -> int:
@@ -183,73 +182,72 @@ class EmbeddingService:
         if isinstance(graph_backend, Node2VecGraphEmbeddingBackend):
             graph_backend.seed = seed
         embeddings = graph_backend.embed(node_ids, edges)
-        updated = 0
+        rows: list[dict[str, Any]] = []
         for node_id in sorted(embeddings.keys()):
-            props = props_by_id.get(node_id, {})
-            if self._upsert_embedding(
-                label=concept_label,
-                node_id=node_id,
-                props=props,
-                embedding_field="embedding_graph",
-                embedding=embeddings[node_id],
-                model_name=graph_backend.model_name,
-                model_version=graph_backend.model_name,
-                content_hash=hash_graph_content(node_id=node_id, neighbours=sorted(neighbours_by_id.get(node_id, set()))),
-                now=now,
-            ):
-                updated += 1
-        return updated
+            content_hash = hash_graph_content(node_id=node_id, neighbours=sorted(neighbours_by_id.get(node_id, set())))
+            if _needs_embedding(props_by_id.get(node_id, {}), "embedding_graph", content_hash):
+                rows.append({"id": node_id, "embedding": embeddings[node_id], "content_hash": content_hash})
+        return self._write_embeddings(
+            label=concept_label,
+            embedding_field="embedding_graph",
+            rows=rows,
+            model_name=graph_backend.model_name,
+            model_version=graph_backend.model_name,
+            now=now,
+        )
 
     def _fetch_nodes(self, label: str) -> list[dict[str, Any]]:
         return self._client.run(f"MATCH (n:{label}) RETURN n.id AS id, properties(n) AS props")
 
-    def _upsert_embedding(
+    def _write_embeddings(
         self,
         *,
         label: str,
-        node_id: str,
-        props: Mapping[str, Any],
         embedding_field: str,
-        embedding: list[float],
+        rows: list[dict[str, Any]],
         model_name: str,
         model_version: str,
-        content_hash: str,
         now: datetime,
-    ) -> bool:
+    ) -> int:
+        """Persist ``rows`` of ``{id, embedding, content_hash}`` with one UNWIND query."""
+
+        if not rows:
+            return 0
         model_field = f"{embedding_field}_model"
-        existing = props.get(embedding_field)
         hash_field = f"{embedding_field}_content_hash"
-        existing_hash = props.get(hash_field) or props.get("content_hash")
-        if existing is not None and existing_hash == content_hash:
-            return False
-
         self._client.run(
             (
-                f"MATCH (n:{label} {{id: $id}}) "
-                f"SET n.{embedding_field} = $embedding, "
+                "UNWIND $rows AS row "
+                f"MATCH (n:{label} {{id: row.id}}) "
+                f"SET n.{embedding_field} = row.embedding, "
                 "n.embedding_model = $embedding_model, "
                 "n.embedding_model_version = $embedding_model_version, "
-                "n.content_hash = $content_hash, "
-                f"n.{hash_field} = $content_hash, "
+                "n.content_hash = row.content_hash, "
+                f"n.{hash_field} = row.content_hash, "
                 "n.embedding_updated_at = datetime($embedding_updated_at), "
                 f"n.{model_field} = $embedding_model"
             ),
             {
-                "id": node_id,
-                "embedding": embedding,
+                "rows": rows,
                 "embedding_model": model_name,
                 "embedding_model_version": model_version,
-                "content_hash": content_hash,
                 "embedding_updated_at": _to_iso(now),
             },
         )
-        logger.info(
-            "execution_trace.embed_generation_persist label=%s node_id=%s field=%s",
-            label,
-            node_id,
-            embedding_field,
-        )
-        return True
+        for row in rows:
+            logger.info(
+                "execution_trace.embed_generation_persist label=%s node_id=%s field=%s",
+                label,
+                row["id"],
+                embedding_field,
+            )
+        return len(rows)
+
+
+def _needs_embedding(props: Mapping[str, Any], embedding_field: str, content_hash: str) -> bool:
+    existing = props.get(embedding_field)
+    existing_hash = props.get(f"{embedding_field}_content_hash") or props.get("content_hash")
+    return existing is None or existing_hash != content_hash
 
 
 def _to_iso(dt: datetime) -> str:
@@ -261,10 +259,7 @@ def _to_iso(dt: datetime) -> str:
 def _hash_text_embedding(text: str, dimensions: int) -> list[float]:
     normalized = text.strip().lower().encode("utf-8")
     digest = hashlib.sha256(normalized).digest()
-    values: list[float] = []
-    for idx in range(dimensions):
-        byte = digest[idx % len(digest)]
-        values.append((byte / 127.5) - 1.0)
+    values = [(digest[idx % len(digest)] / 127.5) - 1.0 for idx in range(dimensions)]
     norm = math.sqrt(sum(value * value for value in values)) or 1.0
     return [value / norm for value in values]
 
@@ -308,19 +303,23 @@ def _deterministic_graph_embedding(
         adjacency[src].add(dst)
         adjacency[dst].add(src)
 
+    ordered_ids = sorted(adjacency.keys())
+    neighbours_by_id = {node_id: sorted(adjacency[node_id]) for node_id in ordered_ids}
     vectors: dict[str, list[float]] = {}
-    for node_id in sorted(adjacency.keys()):
+    for node_id in ordered_ids:
         rng = random.Random(f"{seed}:{node_id}")
         vectors[node_id] = [rng.uniform(-1.0, 1.0) for _ in range(dimensions)]
 
     for _ in range(3):
         next_vectors: dict[str, list[float]] = {}
-        for node_id in sorted(adjacency.keys()):
+        for node_id in ordered_ids:
             base = vectors[node_id]
-            neighbours = sorted(adjacency[node_id])
+            neighbours = neighbours_by_id[node_id]
             if not neighbours:
                 next_vectors[node_id] = _normalize(base)
                 continue
+            # Plain left-to-right accumulation: sum() uses compensated summation on
+            # Python 3.12+, which would change the stored embeddings bit for bit.
             merged = [0.0] * dimensions
             for neighbour in neighbours:
                 nvec = vectors[neighbour]
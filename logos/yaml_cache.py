@@ -0,0 +1,45 @@
+"""Cached YAML parsing for knowledgebase configuration files."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# libyaml-backed loader when PyYAML was built with it; same semantics as SafeLoader.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def file_signature(path: Path) -> tuple[int, int, int]:
+    """Return ``(mtime_ns, size, inode)`` for keying caches that must drop stale files."""
+
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def load_yaml_cached(path: Path) -> Any:
+    """Parse ``path`` once per file version and return the shared result.
+
+    The cache is keyed on the path plus its mtime, size and inode, so a file that is
+    edited or replaced is parsed again on the next call. Callers must not mutate the
+    returned object. Missing files raise ``FileNotFoundError`` and invalid YAML raises
+    ``yaml.YAMLError``; neither outcome is cached.
+    """
+
+    return _parse_yaml(str(path), *file_signature(path))
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int, size: int, inode: int) -> Any:
+    return yaml.load(Path(path).read_bytes(), Loader=YAML_LOADER)
+
+
+def clear_yaml_cache() -> None:
+    """Drop every cached parse, primarily for tests."""
+
+    _parse_yaml.cache_clear()
+
+
+__all__ = ["YAML_LOADER", "clear_yaml_cache", "file_signature", "load_yaml_cached"]
@@ -7,18 +7,23 @@ and print a compact summary of the extracted preview.
 from __future__ import annotations
 
 import argparse
+import asyncio
 import os
+import random
 import signal
 import subprocess
 import sys
 import time
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Mapping
 
 import httpx
 
 
 DEFAULT_BASE_URL = os.getenv("LOGOS_BASE_URL", "http://127.0.0.1:8000")
+POLL_INITIAL_DELAY = 0.25
+POLL_MAX_DELAY = 5.0
 DEFAULT_SAMPLE_TEXT = (
     "Alex at Example Corp will send the contract draft to Pat from Contoso next week."
 )
@@ -63,73 +68,144 @@ class AppProcess:
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
-        if self.process:
-            try:
-                self.process.send_signal(signal.SIGINT)
-                self.process.wait(timeout=10)
-            except Exception:
-                self.process.kill()
-
-
-def wait_for_ready(base_url: str, timeout: float = 30.0) -> None:
+        if not self.process:
+            return
+        try:
+            self.process.send_signal(signal.SIGINT)
+        except ProcessLookupError:
+            return
+        # Poll without blocking so a prompt shutdown returns immediately.
+        for _ in range(50):
+            if self.process.poll() is not None:
+                return
+            time.sleep(0.1)
+        try:
+            self.process.kill()
+            self.process.wait(timeout=1)
+        except (ProcessLookupError, subprocess.TimeoutExpired):
+            pass
+
+
+async def _backoff_sleep(delay: float, max_delay: float = POLL_MAX_DELAY) -> float:
+    """Sleep for ``delay`` with ±20% jitter and return the next, doubled delay."""
+
+    await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+    return min(max_delay, delay * 2)
+
+
+async def _wait_for_port(host: str, port: int, deadline: float) -> None:
+    """Wait until ``host:port`` accepts TCP connections or ``deadline`` passes."""
+
+    while time.time() < deadline:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=0.2)
+        except (OSError, asyncio.TimeoutError):
+            await asyncio.sleep(0.05)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return
+
+
+async def wait_for_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
     deadline = time.time() + timeout
-    with httpx.Client() as client:
-        while time.time() < deadline:
-            try:
-                resp = client.get(f"{base_url}/health", timeout=5)
-                if resp.status_code == 200:
-                    return
-            except httpx.HTTPError:
-                pass
-            time.sleep(1)
+    url = client.base_url
+    if url.host:
+        port = url.port or (443 if url.scheme == "https" else 80)
+        await _wait_for_port(url.host, port, deadline)
+    delay = POLL_INITIAL_DELAY
+    while time.time() < deadline:
+        try:
+            resp = await client.get("/health", timeout=1)
+            if resp.status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        delay = await _backoff_sleep(delay)
     raise RuntimeError("FastAPI app did not become ready in time")
 
 
-def ingest_text(base_url: str, text: str, topic: str | None = None) -> str:
+async def ingest_text(client: httpx.AsyncClient, text: str, topic: str | None = None) -> str:
     payload: dict[str, Any] = {"text": text}
     if topic:
         payload["topic"] = topic
-    with httpx.Client() as client:
-        resp = client.post(f"{base_url}/api/v1/ingest/text", json=payload, timeout=30)
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await client.post("/api/v1/ingest/text", json=payload, timeout=30)
+    resp.raise_for_status()
+    data = resp.json()
     interaction_id = data.get("interaction_id")
     if not interaction_id:
         raise RuntimeError("Ingest response missing interaction_id")
     return interaction_id
 
 
-def poll_status(base_url: str, interaction_id: str, timeout: float = 60.0) -> str:
-    status_url = f"{base_url}/api/v1/interactions/{interaction_id}/status"
+async def poll_status(
+    client: httpx.AsyncClient,
+    interaction_id: str,
+    timeout: float = 60.0,
+    max_delay: float = POLL_MAX_DELAY,
+) -> str:
+    status_url = f"/api/v1/interactions/{interaction_id}/status"
     deadline = time.time() + timeout
-    with httpx.Client() as client:
-        while time.time() < deadline:
-            resp = client.get(status_url, timeout=10)
-            resp.raise_for_status()
-            state = resp.json().get("state")
+    delay = POLL_INITIAL_DELAY
+    last_problem: str | None = None
+    while time.time() < deadline:
+        try:
+            resp = await client.get(status_url, timeout=10)
+        except httpx.HTTPError as exc:
+            last_problem = f"{type(exc).__name__}: {exc}"
+            delay = await _backoff_sleep(delay, max_delay)
+            continue
+        if resp.is_success:
+            data = resp.json()
+            state = data.get("state")
             if state == "preview_ready":
                 return state
             if state == "failed":
-                error_message = resp.json().get("error_message")
-                raise RuntimeError(f"Preview failed: {error_message}")
-            time.sleep(2)
-    raise RuntimeError("Preview did not become ready in time")
+                raise RuntimeError(f"Preview failed: {data.get('error_message')}")
+            last_problem = f"state {state!r}"
+        elif resp.is_client_error:
+            resp.raise_for_status()
+        else:
+            last_problem = f"HTTP {resp.status_code}"
+        delay = await _backoff_sleep(delay, max_delay)
+    detail = f" (last: {last_problem})" if last_problem else ""
+    raise RuntimeError(f"Preview did not become ready in time{detail}")
+
+
+async def fetch_preview(client: httpx.AsyncClient, interaction_id: str) -> Mapping[str, Any]:
+    resp = await client.get(f"/api/v1/interactions/{interaction_id}/preview", timeout=30)
+    resp.raise_for_status()
+    return resp.json()
+
+
+def build_client(base_url: str) -> httpx.AsyncClient:
+    """Return a keep-alive client shared by every request in a smoke run."""
+
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=4),
+    )
+
 
+def build_in_process_client() -> httpx.AsyncClient:
+    """Return a client that calls the FastAPI app directly over ASGI, with no server or socket."""
 
-def fetch_preview(base_url: str, interaction_id: str) -> Mapping[str, Any]:
-    preview_url = f"{base_url}/api/v1/interactions/{interaction_id}/preview"
-    with httpx.Client() as client:
-        resp = client.get(preview_url, timeout=30)
-        resp.raise_for_status()
-        return resp.json()
+    project_root = str(Path(__file__).resolve().parents[1])
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    from logos.main import app
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://app", timeout=30)
 
 
 def extract_counts(preview: Mapping[str, Any]) -> tuple[int, int, int]:
     entities = preview.get("entities") or {}
-    persons = entities.get("persons") or []
-    orgs = entities.get("orgs") or []
-    commitments = entities.get("commitments") or []
-    return len(persons), len(orgs), len(commitments)
+    return (
+        len(entities.get("persons") or ()),
+        len(entities.get("orgs") or ()),
+        len(entities.get("commitments") or ()),
+    )
 
 
 def extract_summary(preview: Mapping[str, Any]) -> str:
@@ -138,14 +214,25 @@ def extract_summary(preview: Mapping[str, Any]) -> str:
     return str(summary).strip()
 
 
-def run_smoke(base_url: str, sample_text: str, start_app: bool, port: int) -> SmokeResult:
-    with AppProcess(start_app, port):
-        wait_for_ready(base_url)
-        interaction_id = ingest_text(base_url, sample_text)
-        poll_status(base_url, interaction_id)
-        preview = fetch_preview(base_url, interaction_id)
-        person_count, org_count, commitment_count = extract_counts(preview)
-        summary = extract_summary(preview)
+async def _exercise_preview(client: httpx.AsyncClient, sample_text: str) -> tuple[str, Mapping[str, Any]]:
+    interaction_id = await ingest_text(client, sample_text)
+    await poll_status(client, interaction_id)
+    return interaction_id, await fetch_preview(client, interaction_id)
+
+
+async def _run_smoke_async(
+    base_url: str, sample_text: str, start_app: bool, port: int, in_process: bool = False
+) -> SmokeResult:
+    if in_process:
+        async with build_in_process_client() as client:
+            interaction_id, preview = await _exercise_preview(client, sample_text)
+    else:
+        with AppProcess(start_app, port):
+            async with build_client(base_url) as client:
+                await wait_for_ready(client)
+                interaction_id, preview = await _exercise_preview(client, sample_text)
+    person_count, org_count, commitment_count = extract_counts(preview)
+    summary = extract_summary(preview)
     return SmokeResult(
         interaction_id=interaction_id,
         summary=summary,
@@ -155,6 +242,12 @@ def run_smoke(base_url: str, sample_text: str, start_app: bool, port: int) -> Sm
     )
 
 
+def run_smoke(
+    base_url: str, sample_text: str, start_app: bool, port: int, in_process: bool = False
+) -> SmokeResult:
+    return asyncio.run(_run_smoke_async(base_url, sample_text, start_app, port, in_process))
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Smoke test ingest → preview")
     parser.add_argument(
@@ -183,13 +276,24 @@ def parse_args() -> argparse.Namespace:
         default=8000,
         help="Port to start FastAPI on when managed by this script",
     )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Call the FastAPI app in-process over ASGI instead of starting uvicorn",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
     base_url = args.base_url.rstrip("/")
-    result = run_smoke(base_url, args.text, start_app=not args.no_start, port=args.port)
+    result = run_smoke(
+        base_url,
+        args.text,
+        start_app=not args.no_start,
+        port=args.port,
+        in_process=args.in_process,
+    )
     print("\nSmoke test preview ready")
     print(f"Interaction ID: {result.interaction_id}")
     if result.summary:
@@ -0,0 +1,68 @@
+"""Small assertion, loading and fixture-building helpers shared across the tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import httpx
+import orjson
+import yaml
+
+from logos.graphio.schema_store import SchemaStore
+from logos.yaml_cache import YAML_LOADER
+
+
+def json_of(response: httpx.Response) -> Any:
+    """Decode a response body with orjson instead of the stdlib parser."""
+
+    return orjson.loads(response.content)
+
+
+def load_yaml(path: Path) -> Any:
+    """Parse a YAML file with the libyaml-backed safe loader when PyYAML was built with it."""
+
+    return yaml.load(path.read_bytes(), Loader=YAML_LOADER)
+
+
+_CONCEPT_NODE_TYPES = {
+    "Concept": {"properties": ["name", "status", "parent_form", "provenance", "embedding_graph"]},
+    "Particular": {"properties": ["name", "embedding_text"]},
+    "Interaction": {"properties": ["summary", "embedding_text"]},
+}
+_CONCEPT_RULES = {
+    "schema_conventions": {
+        "concept_label": "Concept",
+        "particular_label": "Particular",
+        "interaction_label": "Interaction",
+        "candidate_instance_of_relationship": "CANDIDATE_INSTANCE_OF",
+        "instance_of_relationship": "INSTANCE_OF",
+        "in_cluster_relationship": "IN_CLUSTER",
+    }
+}
+
+
+def build_concept_schema_store(persist_dir: Path | None = None) -> SchemaStore:
+    """Schema store for the concept clustering and governance tests.
+
+    Recorded types stay in memory unless ``persist_dir`` is given, in which case
+    the store is mutable and writes its YAML files there.
+    """
+
+    paths = (
+        {
+            "node_types_path": persist_dir / "node_types.yml",
+            "relationship_types_path": persist_dir / "relationship_types.yml",
+            "version_path": persist_dir / "version.yml",
+        }
+        if persist_dir is not None
+        else {}
+    )
+    return SchemaStore.from_mapping(
+        _CONCEPT_NODE_TYPES,
+        {},
+        _CONCEPT_RULES,
+        {"version": 1, "last_updated": None},
+        mutable=persist_dir is not None,
+        **paths,
+    )
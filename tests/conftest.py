@@ -1,8 +1,164 @@
+import atexit
 import os
+import re
+import shutil
 import tempfile
+from pathlib import Path
 
-TEST_RUNTIME_DIR = tempfile.mkdtemp(prefix="logos_test_")
+import pytest
+import pytest_asyncio
+
+# Each xdist worker gets its own runtime directory so staging/feedback files never collide.
+TEST_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "master")
+TEST_RUNTIME_DIR = tempfile.mkdtemp(prefix=f"logos_test_{TEST_WORKER_ID}_")
+atexit.register(shutil.rmtree, TEST_RUNTIME_DIR, ignore_errors=True)
 
 os.environ.setdefault("LOGOS_STAGING_DIR", os.path.join(TEST_RUNTIME_DIR, "staging"))
 os.environ.setdefault("LOGOS_FEEDBACK_DIR", os.path.join(TEST_RUNTIME_DIR, "feedback"))
 os.environ.setdefault("LOGOS_SCHEMA_MUTABLE", "0")
+
+# Import the app once while conftest loads, after the environment above is in place,
+# so route registration and pipeline loading are not charged to whichever test module
+# happens to be collected first.
+from logos import main as _main  # noqa: E402
+
+
+_MERGE_THRESHOLDS_YAML = b"""metadata:
+  version: "0.0.1"
+  updated_at: "2024-01-01T00:00:00Z"
+  updated_by: "system"
+
+defaults:
+  name_similarity: 0.8
+  org_similarity: 0.9
+"""
+
+
+@pytest.fixture(scope="session")
+def kb_template(tmp_path_factory) -> Path:
+    """Minimal knowledgebase with only ``rules/merge_thresholds.yml``, written once per session."""
+
+    base = tmp_path_factory.mktemp("kb_template")
+    (base / "rules").mkdir()
+    (base / "rules" / "merge_thresholds.yml").write_bytes(_MERGE_THRESHOLDS_YAML)
+    return base
+
+
+@pytest.fixture
+def seeded_kb(kb_template: Path, tmp_path: Path) -> Path:
+    """Per-test copy of ``kb_template`` at ``tmp_path / "kb"``; learning stages write into it freely."""
+
+    return Path(shutil.copytree(kb_template, tmp_path / "kb"))
+
+
+@pytest.fixture
+def schema_store():
+    """Empty in-memory schema store per test; recorded types never reach disk."""
+
+    from logos.graphio.schema_store import SchemaStore
+
+    return SchemaStore.from_mapping()
+
+
+@pytest.fixture
+def concept_schema_store():
+    """Per-test concept schema store that never writes to disk."""
+
+    from tests._helpers import build_concept_schema_store
+
+    return build_concept_schema_store()
+
+
+@pytest.fixture(scope="session")
+def rule_only_selection():
+    from logos.model_tiers import ModelSelection
+
+    return ModelSelection(task="summary_interaction", tier="rule_only", name="rule_engine", parameters={})
+
+
+@pytest.fixture(scope="session")
+def app():
+    return _main.app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    from fastapi.testclient import TestClient
+
+    # Not entered as a context manager: running the lifespan would start the
+    # meta-controller loop for the whole session, which per-test clients never did.
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(app):
+    """One ASGITransport for every async client; it only wraps the app and holds no connections."""
+
+    import httpx
+
+    return httpx.ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture
+async def async_client(asgi_transport):
+    """ASGI-direct client for single-request tests; skips TestClient's portal thread."""
+
+    import httpx
+
+    async with httpx.AsyncClient(transport=asgi_transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def asgi_client(asgi_transport):
+    """ASGI client shared by a module's tests.
+
+    Tests using it must run on the module event loop, e.g. with
+    ``pytestmark = pytest.mark.asyncio(loop_scope="module")``.
+    """
+
+    import httpx
+
+    async with httpx.AsyncClient(transport=asgi_transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def dependency_overrides(app):
+    """Yield ``app.dependency_overrides`` and clear it once the test finishes.
+
+    Set overrides before the first request of a test: FastAPI consults this mapping
+    per request, so a late override only affects later requests. The dependency
+    graph itself is built once when routes are registered.
+    """
+
+    assert not app.dependency_overrides, "dependency overrides leaked from another test"
+    try:
+        yield app.dependency_overrides
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def _profile_test(request):
+    """Write a pyinstrument HTML profile per test when LOGOS_PROFILE_TESTS=1."""
+
+    if os.environ.get("LOGOS_PROFILE_TESTS") != "1":
+        yield
+        return
+    try:
+        from pyinstrument import Profiler
+    except ImportError:  # pragma: no cover - optional profiling dependency
+        yield
+        return
+
+    profiler = Profiler(async_mode="disabled")
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+        out_dir = Path(os.environ.get("LOGOS_PROFILE_DIR", ".profiles"))
+        out_dir.mkdir(parents=True, exist_ok=True)
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", request.node.nodeid)
+        (out_dir / f"{name}.html").write_text(profiler.output_html(), encoding="utf-8")
@@ -1,12 +1,7 @@
-import pathlib
-import sys
-
 import asyncio
 
 import pytest
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from logos.events.bus import InMemoryEventBus
 from logos.events.types import EventEnvelope
 from logos.meta.activation import ActivationGraph, WeightedEdge
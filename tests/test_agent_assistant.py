@@ -1,9 +1,6 @@
 from datetime import datetime, timezone
-
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from logos.agents.assistant import (
     AgentContextBuffer,
@@ -11,16 +8,17 @@ from logos.agents.assistant import (
     record_agent_assist,
     summarise_interaction_for_user,
 )
-from logos.graphio.schema_store import SchemaStore
-from logos.model_tiers import ModelConfigError, ModelSelection
+from logos.model_tiers import ModelConfigError
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
 
 class FakeTx:
     def __init__(self) -> None:
-        self.calls: list[tuple[str, dict]] = []
+        self.calls: list[tuple[str, Mapping[str, Any]]] = []
 
-    def run(self, cypher: str, params: dict | None = None):
-        self.calls.append((cypher, params or {}))
+    def run(self, cypher: str, params: Mapping[str, Any] | None = None):
+        self.calls.append((cypher, params if params is not None else _EMPTY))
         return []
 
 
@@ -33,15 +31,9 @@ class FakeClient:
         fn(self.tx)
 
 
-def test_record_agent_assist_runs_transaction(tmp_path):
+def test_record_agent_assist_runs_transaction(schema_store):
     client = FakeClient()
     now = datetime(2024, 2, 1, tzinfo=timezone.utc)
-    store = SchemaStore(
-        tmp_path / "node_types.yml",
-        tmp_path / "relationship_types.yml",
-        tmp_path / "rules.yml",
-        tmp_path / "version.yml",
-    )
 
     record_agent_assist(
         "user_2",
@@ -50,7 +42,7 @@ def test_record_agent_assist_runs_transaction(tmp_path):
         agent_name="Beta",
         client_factory=lambda: client,
         now=now,
-        schema_store=store,
+        schema_store=schema_store,
     )
 
     assert client.tx is not None
@@ -60,19 +52,17 @@ def test_record_agent_assist_runs_transaction(tmp_path):
     assert any("Person" in stmt for stmt in cyphers)
 
 
-def test_summarise_interaction_records_assist_and_returns_summary():
+def test_summarise_interaction_records_assist_and_returns_summary(rule_only_selection):
     calls: list[dict] = []
 
     def _record(user_id: str, user_name: str | None = None, **kwargs) -> None:
         calls.append({"user_id": user_id, "user_name": user_name, **kwargs})
 
-    selection = ModelSelection(task="summary_interaction", tier="rule_only", name="rule_engine", parameters={})
-
     result = summarise_interaction_for_user(
         "One two three four five six.",
         "user_3",
         user_name="User Three",
-        model_selector=lambda task: selection,
+        model_selector=lambda task: rule_only_selection,
         record_assist_fn=_record,
         memory_rules={"agent_context": {"fallback_summary_max_words": 3}},
     )
@@ -119,15 +109,13 @@ def test_context_buffer_stores_recent_turns():
     assert recent_user_a[-1]["response"] == "Noted"
 
 
-def test_summarise_updates_context_buffer():
+def test_summarise_updates_context_buffer(rule_only_selection):
     buffer = AgentContextBuffer(memory_rules={"agent_context": {"context_turn_limit": 5}})
 
-    selection = ModelSelection(task="summary_interaction", tier="rule_only", name="rule_engine", parameters={})
-
     summarise_interaction_for_user(
         "One two three four five six seven eight nine ten.",
         "user_context",
-        model_selector=lambda task: selection,
+        model_selector=lambda task: rule_only_selection,
         record_assist_fn=lambda *args, **kwargs: None,
         context_buffer=buffer,
     )
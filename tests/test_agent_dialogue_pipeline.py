@@ -7,7 +7,12 @@ from logos.llm.prompt import PromptEngineError
 from logos.pipelines import agent_dialogue
 
 
-def test_agent_dialogue_pipeline_risk_flow_references_learned_weights(monkeypatch):
+@pytest.fixture(scope="module")
+def loader():
+    return PipelineLoader(STAGE_REGISTRY, path=DEFAULT_PIPELINE_PATH)
+
+
+def test_agent_dialogue_pipeline_risk_flow_references_learned_weights(loader, monkeypatch):
     monkeypatch.setattr(
         agent_dialogue,
         "get_top_paths",
@@ -38,7 +43,6 @@ def test_agent_dialogue_pipeline_risk_flow_references_learned_weights(monkeypatc
 
     monkeypatch.setattr(agent_dialogue.PROMPT_ENGINE, "run_prompt", fake_run_prompt)
 
-    loader = PipelineLoader(STAGE_REGISTRY, path=DEFAULT_PIPELINE_PATH)
     ctx = PipelineContext(request_id="req-1", user_id="tester")
     payload = {"query": "Show me risks", "project_id": "project-1"}
 
@@ -51,11 +55,10 @@ def test_agent_dialogue_pipeline_risk_flow_references_learned_weights(monkeypatc
     assert captured["prompt_path"] == "agent/explain_risk.yml"
 
 
-def test_agent_dialogue_pipeline_summary_prompt(monkeypatch):
+def test_agent_dialogue_pipeline_summary_prompt(loader, monkeypatch):
     monkeypatch.setattr(agent_dialogue, "search_entities", lambda _: [{"id": "e1", "name": "Issue A"}])
     monkeypatch.setattr(agent_dialogue.PROMPT_ENGINE, "run_prompt", lambda *_: "summary response")
 
-    loader = PipelineLoader(STAGE_REGISTRY, path=DEFAULT_PIPELINE_PATH)
     ctx = PipelineContext(request_id="req-2", user_id="tester")
     payload = {"query": "Summarize open issues"}
 
@@ -64,7 +67,7 @@ def test_agent_dialogue_pipeline_summary_prompt(monkeypatch):
     assert result["agent_response"] == "summary response"
 
 
-def test_agent_dialogue_pipeline_fails_explicitly_when_local_llm_unavailable(monkeypatch):
+def test_agent_dialogue_pipeline_fails_explicitly_when_local_llm_unavailable(loader, monkeypatch):
     monkeypatch.setattr(agent_dialogue, "search_entities", lambda _: [{"id": "e1", "name": "Issue A"}])
 
     def fail_prompt(*_args, **_kwargs):
@@ -72,7 +75,6 @@ def test_agent_dialogue_pipeline_fails_explicitly_when_local_llm_unavailable(mon
 
     monkeypatch.setattr(agent_dialogue.PROMPT_ENGINE, "run_prompt", fail_prompt)
 
-    loader = PipelineLoader(STAGE_REGISTRY, path=DEFAULT_PIPELINE_PATH)
     ctx = PipelineContext(request_id="req-3", user_id="tester")
 
     with pytest.raises(PipelineStageError, match="Local LLM backend unavailable"):
@@ -1,15 +1,8 @@
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
-from fastapi.testclient import TestClient
-
 from logos import main
+from tests._helpers import json_of
 
 
-def test_alerts_lists(monkeypatch):
-    client = TestClient(main.app)
+def test_alerts_lists(client, monkeypatch):
     calls: list[str] = []
 
     def fake_run_query(query, params=None):  # type: ignore[unused-argument]
@@ -31,7 +24,8 @@ def test_alerts_lists(monkeypatch):
 
     response = client.get("/alerts")
     assert response.status_code == 200
-    assert response.json() == {
+    body = json_of(response)
+    assert body == {
         "unresolved_commitments": [
             {
                 "id": "c1",
@@ -1,18 +1,9 @@
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
-from fastapi.testclient import TestClient
-
-from logos import main
 from logos.api.routes import concepts as concept_routes
 from logos.learning.clustering.concept_governance import ConceptPromotionError, MergeResult, PromotionResult, RejectionResult
+from tests._helpers import json_of
 
 
-def test_promote_concept_endpoint_success(monkeypatch):
-    client = TestClient(main.app)
-
+def test_promote_concept_endpoint_success(client, monkeypatch):
     def fake_promote(concept_id: str, *, promoted_by: str = "api"):
         assert concept_id == "c-1"
         assert promoted_by == "reviewer-1"
@@ -28,7 +19,8 @@ def test_promote_concept_endpoint_success(monkeypatch):
     response = client.post("/concept/promote/c-1", headers={"x-actor-id": "reviewer-1"})
 
     assert response.status_code == 200
-    assert response.json() == {
+    body = json_of(response)
+    assert body == {
         "concept_id": "c-1",
         "status": "canonical",
         "converted_relationships": 4,
@@ -36,9 +28,7 @@ def test_promote_concept_endpoint_success(monkeypatch):
     }
 
 
-def test_promote_concept_endpoint_rejects_non_proposed(monkeypatch):
-    client = TestClient(main.app)
-
+def test_promote_concept_endpoint_rejects_non_proposed(client, monkeypatch):
     def fake_promote(concept_id: str, *, promoted_by: str = "api"):
         raise ConceptPromotionError(
             code="CONCEPT_NOT_PROPOSED",
@@ -50,12 +40,11 @@ def test_promote_concept_endpoint_rejects_non_proposed(monkeypatch):
     response = client.post("/api/v1/concept/promote/c-2")
 
     assert response.status_code == 409
-    assert response.json()["error"] == "concept_not_proposed"
-
+    body = json_of(response)
+    assert body["error"] == "concept_not_proposed"
 
-def test_merge_concept_endpoint_success(monkeypatch):
-    client = TestClient(main.app)
 
+def test_merge_concept_endpoint_success(client, monkeypatch):
     def fake_merge(proposed_concept_id: str, target_concept_id: str, *, merged_by: str = "api"):
         assert proposed_concept_id == "proposal-1"
         assert target_concept_id == "concept-1"
@@ -72,13 +61,12 @@ def test_merge_concept_endpoint_success(monkeypatch):
     response = client.post("/api/v1/concept/merge/proposal-1/concept-1", headers={"x-actor-id": "reviewer-2"})
 
     assert response.status_code == 200
-    assert response.json()["status"] == "merged"
-    assert response.json()["repointed_relationships"] == 3
-
+    body = json_of(response)
+    assert body["status"] == "merged"
+    assert body["repointed_relationships"] == 3
 
-def test_reject_concept_endpoint_success(monkeypatch):
-    client = TestClient(main.app)
 
+def test_reject_concept_endpoint_success(client, monkeypatch):
     def fake_reject(concept_id: str, *, rejected_by: str = "api", reason: str | None = None):
         assert concept_id == "proposal-9"
         assert rejected_by == "reviewer-4"
@@ -96,5 +84,6 @@ def test_reject_concept_endpoint_success(monkeypatch):
     )
 
     assert response.status_code == 200
-    assert response.json()["status"] == "rejected"
-    assert response.json()["rejection_provenance"]["reason"] == "low-confidence"
+    body = json_of(response)
+    assert body["status"] == "rejected"
+    assert body["rejection_provenance"]["reason"] == "low-confidence"
@@ -1,16 +1,11 @@
-import pathlib
-import sys
+import pytest
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
-from fastapi.testclient import TestClient
-
-from logos import main
 from logos.api.routes import agents as agents_routes
+from tests._helpers import json_of
 
 
-def test_agent_query_endpoint(monkeypatch):
-    client = TestClient(main.app)
+@pytest.mark.asyncio
+async def test_agent_query_endpoint(async_client, dependency_overrides):
     captured = {}
 
     def fake_run_pipeline(name, input_bundle, ctx):
@@ -31,10 +26,10 @@ def test_agent_query_endpoint(monkeypatch):
     def fake_append_feedback(bundle):
         captured["feedback_bundle"] = bundle
 
-    monkeypatch.setattr(agents_routes, "run_pipeline", fake_run_pipeline)
-    monkeypatch.setattr(agents_routes, "append_feedback", fake_append_feedback)
+    dependency_overrides[agents_routes.get_pipeline_runner] = lambda: fake_run_pipeline
+    dependency_overrides[agents_routes.get_feedback_writer] = lambda: fake_append_feedback
 
-    response = client.post(
+    response = await async_client.post(
         "/api/v1/agent/query",
         json={
             "query": "What risks affect Project X?",
@@ -44,7 +39,7 @@ def test_agent_query_endpoint(monkeypatch):
     )
 
     assert response.status_code == 200
-    assert response.json() == {
+    assert json_of(response) == {
         "agent_response": "Agent says hi.",
         "reasoning": [{"path": "p1"}],
         "proposed_actions": [{"type": "notify"}],
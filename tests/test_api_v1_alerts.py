@@ -1,62 +1,23 @@
-import pathlib
-import sys
+from unittest.mock import Mock
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+import pytest
 
-from fastapi.testclient import TestClient
-
-from logos import main
 from logos.api.routes import alerts as alerts_route
+from logos.core.pipeline_executor import run_pipeline
 from logos.graphio import queries as graph_queries
+from tests._helpers import json_of
 
 
-def test_api_v1_alerts_filters(monkeypatch):
-    client = TestClient(main.app)
-    captured: dict[str, object] = {}
-
-    pipeline_calls: list[str] = []
-
-    def fake_run_pipeline(name, payload, context):  # type: ignore[unused-argument]
-        pipeline_calls.append(name)
-        return payload
-
-    monkeypatch.setattr(alerts_route, "run_pipeline", fake_run_pipeline)
+@pytest.mark.asyncio
+async def test_api_v1_alerts_filters(async_client, dependency_overrides):
+    alert_row = {"id": "a1", "type": "unresolved_commitment", "status": "open"}
+    fake_run_pipeline = Mock(spec=run_pipeline)
+    fake_list_alerts = Mock(spec=graph_queries.list_alerts, return_value=([alert_row], 12))
 
-    def fake_list_alerts(
-        *,
-        types=None,
-        statuses=None,
-        project_id=None,
-        stakeholder_id=None,
-        org_id=None,
-        page=1,
-        page_size=20,
-    ):
-        captured.update(
-            {
-                "types": types,
-                "statuses": statuses,
-                "project_id": project_id,
-                "stakeholder_id": stakeholder_id,
-                "org_id": org_id,
-                "page": page,
-                "page_size": page_size,
-            }
-        )
-        return (
-            [
-                {
-                    "id": "a1",
-                    "type": "unresolved_commitment",
-                    "status": "open",
-                }
-            ],
-            12,
-        )
+    dependency_overrides[alerts_route.get_pipeline_runner] = lambda: fake_run_pipeline
+    dependency_overrides[alerts_route.get_list_alerts_fn] = lambda: fake_list_alerts
 
-    monkeypatch.setattr(graph_queries, "list_alerts", fake_list_alerts)
-
-    response = client.get(
+    response = await async_client.get(
         "/api/v1/alerts"
         "?type=unresolved_commitment"
         "&status=open"
@@ -68,7 +29,7 @@ def test_api_v1_alerts_filters(monkeypatch):
     )
 
     assert response.status_code == 200
-    assert captured == {
+    assert fake_list_alerts.call_args.kwargs == {
         "types": ["unresolved_commitment"],
         "statuses": ["open"],
         "project_id": "pr1",
@@ -77,15 +38,10 @@ def test_api_v1_alerts_filters(monkeypatch):
         "page": 2,
         "page_size": 5,
     }
-    assert pipeline_calls == ["pipeline.reasoning_alerts"]
-    assert response.json() == {
-        "items": [
-            {
-                "id": "a1",
-                "type": "unresolved_commitment",
-                "status": "open",
-            }
-        ],
+    fake_run_pipeline.assert_called_once()
+    assert fake_run_pipeline.call_args.args[0] == "pipeline.reasoning_alerts"
+    assert json_of(response) == {
+        "items": [alert_row],
         "page": 2,
         "page_size": 5,
         "total_items": 12,
@@ -93,10 +49,8 @@ def test_api_v1_alerts_filters(monkeypatch):
     }
 
 
-
-def test_api_v1_alert_outcome_logs_reinforcement(monkeypatch):
-    client = TestClient(main.app)
-
+@pytest.mark.asyncio
+async def test_api_v1_alert_outcome_logs_reinforcement(async_client, monkeypatch):
     class FakeClient:
         def run(self, query, params):
             assert params["status"] == "closed"
@@ -112,10 +66,10 @@ def test_api_v1_alert_outcome_logs_reinforcement(monkeypatch):
 
     monkeypatch.setattr(alerts_route, "record_alert_outcome", fake_record_alert_outcome)
 
-    response = client.patch("/api/v1/alerts/a1/outcome", json={"status": "closed"})
+    response = await async_client.patch("/api/v1/alerts/a1/outcome", json={"status": "closed"})
 
     assert response.status_code == 200
-    assert response.json()["retraining_action"] == "logged_and_retrained"
+    assert json_of(response)["retraining_action"] == "logged_and_retrained"
     assert captured["alert_id"] == "a1"
     assert captured["outcome_status"] == "closed"
     assert captured["features"]["path_length"] == 2.0
@@ -1,64 +1,77 @@
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
-from fastapi.testclient import TestClient
-
-from logos import main
-from logos.graphio import neo4j_client, queries
-
-
-def test_api_v1_project_map_returns_payload(monkeypatch):
-    client = TestClient(main.app)
-    payload = {
+import orjson
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import Response
+
+from logos.api.routes import projects as projects_route
+from logos.graphio import neo4j_client
+
+
+_PROJECT_MAP_PAYLOAD = {
+    "project": {"id": "pr1", "name": "Project One", "labels": ["Project"]},
+    "stakeholders": [],
+    "orgs": [],
+    "commitments": [],
+    "issues": [],
+    "risks": [],
+    "project_summary": {
         "project": {"id": "pr1", "name": "Project One", "labels": ["Project"]},
         "stakeholders": [],
-        "orgs": [],
-        "commitments": [],
+        "open_commitments": [],
         "issues": [],
-        "risks": [],
-        "project_summary": {
-            "project": {"id": "pr1", "name": "Project One", "labels": ["Project"]},
-            "stakeholders": [],
-            "open_commitments": [],
-            "issues": [],
-        },
-    }
+    },
+}
 
-    def fake_build_view(*, project_id, include_graph):
-        return payload
 
-    monkeypatch.setattr(queries, "build_project_map_view", fake_build_view)
+def _returns_payload(*, project_id, include_graph):
+    return _PROJECT_MAP_PAYLOAD
 
-    response = client.get("/api/v1/projects/pr1/map")
 
-    assert response.status_code == 200
-    assert response.json() == payload
+def _returns_none(*, project_id, include_graph):
+    return None
 
 
-def test_api_v1_project_map_not_found(monkeypatch):
-    client = TestClient(main.app)
+def _raises_graph_unavailable(*, project_id, include_graph):
+    raise neo4j_client.GraphUnavailable("neo4j_unavailable")
 
-    def fake_build_view(*, project_id, include_graph):
-        return None
 
-    monkeypatch.setattr(queries, "build_project_map_view", fake_build_view)
+async def _call_project_map_view(fake_build_view, project_id):
+    """Call the route function directly and map its outcome to (status, body)."""
 
-    response = client.get("/api/v1/projects/missing/map")
+    try:
+        result = await projects_route.project_map_view(
+            project_id, include_graph=True, build_view=fake_build_view
+        )
+    except HTTPException as exc:
+        return exc.status_code, None
+    if isinstance(result, Response):
+        return result.status_code, orjson.loads(result.body)
+    return 200, result
 
-    assert response.status_code == 404
 
+@pytest.mark.parametrize(
+    ("fake_build_view", "project_id", "expected_status", "expected_body"),
+    [
+        pytest.param(_returns_payload, "pr1", 200, _PROJECT_MAP_PAYLOAD, id="returns_payload"),
+        pytest.param(_returns_none, "missing", 404, None, id="not_found"),
+        pytest.param(
+            _raises_graph_unavailable, "pr1", 503, {"error": "neo4j_unavailable"}, id="graph_unavailable"
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_api_v1_project_map(fake_build_view, project_id, expected_status, expected_body):
+    status, body = await _call_project_map_view(fake_build_view, project_id)
 
-def test_api_v1_project_map_reports_graph_unavailable(monkeypatch):
-    client = TestClient(main.app)
+    assert status == expected_status
+    if expected_body is not None:
+        assert body == expected_body
 
-    def fake_build_view(*, project_id, include_graph):
-        raise neo4j_client.GraphUnavailable("neo4j_unavailable")
 
-    monkeypatch.setattr(queries, "build_project_map_view", fake_build_view)
+def test_api_v1_project_map_route_is_mounted(client, dependency_overrides):
+    dependency_overrides[projects_route.get_project_map_builder] = lambda: _returns_payload
 
     response = client.get("/api/v1/projects/pr1/map")
 
-    assert response.status_code == 503
-    assert response.json() == {"error": "neo4j_unavailable"}
+    assert response.status_code == 200
+    assert orjson.loads(response.content) == _PROJECT_MAP_PAYLOAD
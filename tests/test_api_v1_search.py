@@ -1,16 +1,8 @@
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
-from fastapi.testclient import TestClient
-
-from logos import main
 from logos.graphio import queries
+from tests._helpers import json_of
 
 
-def test_api_v1_search_returns_paginated_results(monkeypatch):
-    client = TestClient(main.app)
+def test_api_v1_search_returns_paginated_results(client, monkeypatch):
     captured = {}
 
     def fake_search_fulltext(*, q, labels, org_id, project_id, page, page_size):
@@ -33,7 +25,7 @@ def test_api_v1_search_returns_paginated_results(monkeypatch):
     )
 
     assert response.status_code == 200
-    assert response.json() == {
+    assert json_of(response) == {
         "items": [
             {
                 "entity_type": "person",
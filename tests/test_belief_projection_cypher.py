@@ -1,10 +1,5 @@
 from __future__ import annotations
 
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from logos.beliefs import BeliefProjection, Neo4jBeliefStore
 
 
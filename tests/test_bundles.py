@@ -1,13 +1,9 @@
 import json
-import pathlib
-import sys
 from datetime import datetime, timezone
 
 import pytest
 from pydantic import ValidationError
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from logos.graphio.types import GraphRelationship
 from logos.models.bundles import (
     EntityMention,
@@ -1,116 +1,174 @@
 from __future__ import annotations
 
+import re
+from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+import pytest
 
 from logos.graphio.schema_store import SchemaStore
 from logos.learning.clustering.cluster_engine import ClusterEngine
 from logos.learning.clustering.concept_governance import ConceptGovernance, ConceptPromotionError
+from tests._helpers import build_concept_schema_store
+
+
+# Ordered (required substrings, handler key) pairs; the first full match classifies a query.
+_QUERY_SIGNATURES: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("MERGE (c:", "c.status = 'proposed'"), "merge_concept"),
+    (("MERGE (p)-[r:", "CANDIDATE_INSTANCE_OF"), "merge_candidate"),
+    (("RETURN c.status AS status",), "concept_status"),
+    (("DELETE candidate", "RETURN count(inst) AS converted_count"), "convert_candidates"),
+    (("SET c.status = 'canonical'",), "set_canonical"),
+    (("RETURN c.id AS id",), "concept_exists"),
+    (("RETURN count(moved) AS repointed_count",), "repoint"),
+    (("SET c.status = 'merged'",), "set_merged"),
+    (("SET c.status = 'rejected'",), "set_rejected"),
+)
+# One pass over the query finds every discriminator; the lookahead lets matches overlap.
+_NEEDLE_PATTERN = re.compile(
+    "(?=({}))".format(
+        "|".join(
+            re.escape(needle)
+            for needle in sorted({n for needles, _ in _QUERY_SIGNATURES for n in needles}, key=len, reverse=True)
+        )
+    )
+)
+_CLASSIFIED: dict[str, str] = {}
+_SYNTHETIC_TERMS_20 = tuple(f"new-term-{idx:02d}" for idx in range(20))
+
+
+def _classify(cypher: str) -> str:
+    key = _CLASSIFIED.get(cypher)
+    if key is None:
+        hits = {match.group(1) for match in _NEEDLE_PATTERN.finditer(cypher)}
+        key = next((name for needles, name in _QUERY_SIGNATURES if hits.issuperset(needles)), "")
+        _CLASSIFIED[cypher] = key
+    if not key:
+        raise AssertionError(f"Unexpected query: {cypher}")
+    return key
 
 
 class FakeNeo4jClient:
+    # Concept attributes are stored column-wise, keyed by concept id; ``concept_status``
+    # doubles as the set of known concepts.
+    _CONCEPT_COLUMNS = ("status", "parent_form", "provenance", "created_at", "merged_into", "rejection_provenance")
+
     def __init__(self) -> None:
-        self.concepts: dict[str, dict] = {}
+        self.concept_status: dict[str, str] = {}
+        self.concept_parent_form: dict[str, str] = {}
+        self.concept_provenance: dict[str, dict] = {}
+        self.concept_created_at: dict[str, str] = {}
+        self.concept_merged_into: dict[str, str] = {}
+        self.concept_rejection_provenance: dict[str, dict] = {}
         self.relationships: list[dict] = []
+        self.relationships_by_concept: defaultdict[str, list[dict]] = defaultdict(list)
         self.promotions: list[dict] = []
 
-    def run(self, cypher: str, params: dict | None = None):
-        params = params or {}
-        if "MERGE (c:" in cypher and "c.status = 'proposed'" in cypher:
-            self.concepts[params["id"]] = {"status": "proposed", **dict(params)}
-            return []
-        if "MERGE (p)-[r:" in cypher and "CANDIDATE_INSTANCE_OF" in cypher:
-            self.relationships.append(dict(params))
-            return []
-        if "RETURN c.status AS status" in cypher:
-            concept = self.concepts.get(params["concept_id"])
-            return [{"status": concept.get("status")}] if concept else []
-        if "DELETE candidate" in cypher and "RETURN count(inst) AS converted_count" in cypher:
-            concept_id = params["concept_id"]
-            converted = sum(1 for rel in self.relationships if rel.get("concept_id") == concept_id)
-            return [{"converted_count": converted}]
-        if "SET c.status = 'canonical'" in cypher:
-            concept = self.concepts.get(params["concept_id"])
-            if concept:
-                concept["status"] = "canonical"
-            self.promotions.append(dict(params))
-            return []
-        if "RETURN c.id AS id" in cypher:
-            concept = self.concepts.get(params["concept_id"])
-            return [{"id": params["concept_id"]}] if concept else []
-        if "RETURN count(moved) AS repointed_count" in cypher:
-            source_id = params["source_concept_id"]
-            moved = 0
-            for rel in self.relationships:
-                if rel.get("concept_id") == source_id:
-                    rel["concept_id"] = params["target_concept_id"]
-                    moved += 1
-            return [{"repointed_count": moved}]
-        if "SET c.status = 'merged'" in cypher:
-            concept = self.concepts.get(params["source_concept_id"])
-            if concept:
-                concept["status"] = "merged"
-                concept["merged_into"] = params["target_concept_id"]
-            return []
-        if "SET c.status = 'rejected'" in cypher:
-            concept = self.concepts.get(params["concept_id"])
-            if concept:
-                concept["status"] = "rejected"
-                concept["rejection_provenance"] = params["rejection_provenance"]
-            return []
-        raise AssertionError(f"Unexpected query: {cypher}")
-
+    @property
+    def concepts(self) -> dict[str, dict]:
+        """Row view of the concept columns for assertions."""
 
-def _schema_store(tmp_path: Path) -> SchemaStore:
-    node_types = tmp_path / "node_types.yml"
-    rel_types = tmp_path / "relationship_types.yml"
-    rules = tmp_path / "rules.yml"
-    version = tmp_path / "version.yml"
+        columns = [(name, getattr(self, f"concept_{name}")) for name in self._CONCEPT_COLUMNS]
+        return {
+            concept_id: {name: column[concept_id] for name, column in columns if concept_id in column}
+            for concept_id in self.concept_status
+        }
 
-    node_types.write_text(
-        "node_types:\n"
-        "  Concept:\n"
-        "    properties: [status, parent_form, provenance]\n"
-        "  Particular:\n"
-        "    properties: [name]\n"
-    )
-    rel_types.write_text("relationship_types: {}\n")
-    rules.write_text(
-        "schema_conventions:\n"
-        "  concept_label: Concept\n"
-        "  particular_label: Particular\n"
-        "  candidate_instance_of_relationship: CANDIDATE_INSTANCE_OF\n"
-        "  instance_of_relationship: INSTANCE_OF\n"
-    )
-    version.write_text("version: 1\nlast_updated: null\n")
-    return SchemaStore(node_types, rel_types, rules, version, mutable=True)
-
-
-def test_cluster_governance_creates_only_proposed_concepts_for_new_terms(tmp_path: Path) -> None:
-    client = FakeNeo4jClient()
-    store = _schema_store(tmp_path)
+    def run(self, cypher: str, params: dict | None = None):
+        handler = _DISPATCH[_classify(cypher)]
+        return handler(self, params or {})
+
+    def _merge_concept(self, params: dict):
+        concept_id = params["id"]
+        self.concept_status[concept_id] = "proposed"
+        self.concept_parent_form[concept_id] = params["parent_form"]
+        self.concept_provenance[concept_id] = params["provenance"]
+        self.concept_created_at[concept_id] = params["created_at"]
+        return []
+
+    def _merge_candidate(self, params: dict):
+        rel = dict(params)
+        self.relationships.append(rel)
+        self.relationships_by_concept[rel.get("concept_id")].append(rel)
+        return []
+
+    def _concept_status(self, params: dict):
+        status = self.concept_status.get(params["concept_id"])
+        return [{"status": status}] if status is not None else []
+
+    def _convert_candidates(self, params: dict):
+        return [{"converted_count": len(self.relationships_by_concept.get(params["concept_id"], ()))}]
+
+    def _set_canonical(self, params: dict):
+        concept_id = params["concept_id"]
+        if concept_id in self.concept_status:
+            self.concept_status[concept_id] = "canonical"
+        self.promotions.append(dict(params))
+        return []
+
+    def _concept_exists(self, params: dict):
+        concept_id = params["concept_id"]
+        return [{"id": concept_id}] if concept_id in self.concept_status else []
+
+    def _repoint(self, params: dict):
+        target_id = params["target_concept_id"]
+        moved = self.relationships_by_concept.pop(params["source_concept_id"], [])
+        for rel in moved:
+            rel["concept_id"] = target_id
+        self.relationships_by_concept[target_id].extend(moved)
+        return [{"repointed_count": len(moved)}]
+
+    def _set_merged(self, params: dict):
+        concept_id = params["source_concept_id"]
+        if concept_id in self.concept_status:
+            self.concept_status[concept_id] = "merged"
+            self.concept_merged_into[concept_id] = params["target_concept_id"]
+        return []
+
+    def _set_rejected(self, params: dict):
+        concept_id = params["concept_id"]
+        if concept_id in self.concept_status:
+            self.concept_status[concept_id] = "rejected"
+            self.concept_rejection_provenance[concept_id] = params["rejection_provenance"]
+        return []
+
+
+_DISPATCH = {
+    "merge_concept": FakeNeo4jClient._merge_concept,
+    "merge_candidate": FakeNeo4jClient._merge_candidate,
+    "concept_status": FakeNeo4jClient._concept_status,
+    "convert_candidates": FakeNeo4jClient._convert_candidates,
+    "set_canonical": FakeNeo4jClient._set_canonical,
+    "concept_exists": FakeNeo4jClient._concept_exists,
+    "repoint": FakeNeo4jClient._repoint,
+    "set_merged": FakeNeo4jClient._set_merged,
+    "set_rejected": FakeNeo4jClient._set_rejected,
+}
+
+
+@pytest.fixture
+def client_and_store(concept_schema_store: SchemaStore) -> tuple[FakeNeo4jClient, SchemaStore]:
+    return FakeNeo4jClient(), concept_schema_store
+
+
+def test_cluster_governance_creates_only_proposed_concepts_for_new_terms(client_and_store) -> None:
+    client, store = client_and_store
     engine = ClusterEngine(client=client, schema_store=store)
 
-    synthetic_terms = [f"new-term-{idx:02d}" for idx in range(20)]
     proposed = engine.propose_concept_from_cluster(
         cluster_id="cluster-synthetic-20",
         parent_form="Form:Stakeholder",
-        particular_ids=synthetic_terms,
+        particular_ids=_SYNTHETIC_TERMS_20,
         algorithm="hdbscan",
         created_at=datetime(2024, 5, 20, tzinfo=timezone.utc),
         provenance={"dataset": "synthetic-governance"},
     )
 
-    concept = client.concepts[proposed.concept_id]
     assert proposed.status == "proposed"
-    assert concept["parent_form"] == "Form:Stakeholder"
-    assert concept["provenance"]["cluster_id"] == "cluster-synthetic-20"
-    assert concept["provenance"]["dataset"] == "synthetic-governance"
+    assert client.concept_parent_form[proposed.concept_id] == "Form:Stakeholder"
+    assert client.concept_provenance[proposed.concept_id]["cluster_id"] == "cluster-synthetic-20"
+    assert client.concept_provenance[proposed.concept_id]["dataset"] == "synthetic-governance"
 
     assert len(client.relationships) == 20
     assert all(rel["concept_id"] == proposed.concept_id for rel in client.relationships)
@@ -126,7 +184,7 @@ def test_cluster_governance_creates_only_proposed_concepts_for_new_terms(tmp_pat
 
 def test_cluster_governance_uses_candidate_instance_relationship(tmp_path: Path) -> None:
     client = FakeNeo4jClient()
-    store = _schema_store(tmp_path)
+    store = build_concept_schema_store(tmp_path)
     engine = ClusterEngine(client=client, schema_store=store)
 
     proposed = engine.propose_concept_from_cluster(
@@ -150,9 +208,8 @@ def test_cluster_governance_uses_candidate_instance_relationship(tmp_path: Path)
     assert "CANDIDATE_INSTANCE_OF" in refreshed.relationship_types
 
 
-def test_concept_governance_promotes_and_converts_candidate_relationships(tmp_path: Path) -> None:
-    client = FakeNeo4jClient()
-    store = _schema_store(tmp_path)
+def test_concept_governance_promotes_and_converts_candidate_relationships(client_and_store) -> None:
+    client, store = client_and_store
     engine = ClusterEngine(client=client, schema_store=store)
 
     proposed = engine.propose_concept_from_cluster(
@@ -168,13 +225,12 @@ def test_concept_governance_promotes_and_converts_candidate_relationships(tmp_pa
     assert result.status == "canonical"
     assert result.converted_relationships == 3
     assert result.provenance["promoted_by"] == "reviewer-1"
-    assert client.concepts[proposed.concept_id]["status"] == "canonical"
+    assert client.concept_status[proposed.concept_id] == "canonical"
 
 
-def test_concept_governance_rejects_non_proposed_concepts(tmp_path: Path) -> None:
-    client = FakeNeo4jClient()
-    store = _schema_store(tmp_path)
-    client.concepts["concept-1"] = {"status": "canonical"}
+def test_concept_governance_rejects_non_proposed_concepts(client_and_store) -> None:
+    client, store = client_and_store
+    client.concept_status["concept-1"] = "canonical"
 
     governance = ConceptGovernance(client=client, schema_store=store)
 
@@ -186,9 +242,8 @@ def test_concept_governance_rejects_non_proposed_concepts(tmp_path: Path) -> Non
         raise AssertionError("Expected ConceptPromotionError")
 
 
-def test_concept_governance_merge_repoints_and_preserves_provenance(tmp_path: Path) -> None:
-    client = FakeNeo4jClient()
-    store = _schema_store(tmp_path)
+def test_concept_governance_merge_repoints_and_preserves_provenance(client_and_store) -> None:
+    client, store = client_and_store
     engine = ClusterEngine(client=client, schema_store=store)
 
     proposed = engine.propose_concept_from_cluster(
@@ -197,7 +252,7 @@ def test_concept_governance_merge_repoints_and_preserves_provenance(tmp_path: Pa
         particular_ids=["p-1", "p-2"],
         algorithm="hdbscan",
     )
-    client.concepts["concept-target"] = {"status": "canonical"}
+    client.concept_status["concept-target"] = "canonical"
 
     governance = ConceptGovernance(client=client, schema_store=store)
     result = governance.merge_proposed_concept(proposed.concept_id, "concept-target", merged_by="reviewer-2")
@@ -205,13 +260,14 @@ def test_concept_governance_merge_repoints_and_preserves_provenance(tmp_path: Pa
     assert result.status == "merged"
     assert result.repointed_relationships == 2
     assert result.provenance["target_concept_id"] == "concept-target"
-    assert client.concepts[proposed.concept_id]["status"] == "merged"
+    merged = client.concepts[proposed.concept_id]
+    assert merged["status"] == "merged"
+    assert merged["merged_into"] == "concept-target"
     assert all(rel["concept_id"] == "concept-target" for rel in client.relationships)
 
 
-def test_concept_governance_reject_marks_for_audit(tmp_path: Path) -> None:
-    client = FakeNeo4jClient()
-    store = _schema_store(tmp_path)
+def test_concept_governance_reject_marks_for_audit(client_and_store) -> None:
+    client, store = client_and_store
     engine = ClusterEngine(client=client, schema_store=store)
     proposed = engine.propose_concept_from_cluster(
         cluster_id="cluster-reject",
@@ -225,4 +281,4 @@ def test_concept_governance_reject_marks_for_audit(tmp_path: Path) -> None:
 
     assert result.status == "rejected"
     assert result.provenance["reason"] == "low_cohesion"
-    assert client.concepts[proposed.concept_id]["status"] == "rejected"
+    assert client.concept_status[proposed.concept_id] == "rejected"
@@ -1,15 +1,37 @@
 from __future__ import annotations
 
+import functools
+import re
 from datetime import datetime, timezone
 from pathlib import Path
 
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from logos.graphio.schema_store import SchemaStore
 from logos.services.clustering import ClusteringService
+from tests._helpers import build_concept_schema_store
+
+
+_LABEL_RE = re.compile(r"MATCH \(n:(\w+)\)")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse(cypher: str) -> tuple[str, str | None]:
+    """Classify a query once into ``(kind, label)``; repeat queries hit the cache."""
+
+    if "RETURN n.id AS id, n.embedding_text AS embedding" in cypher:
+        return "embedding_text", _LABEL_RE.search(cypher).group(1)
+    if "RETURN n.id AS id, n.embedding_graph AS embedding" in cypher:
+        return "embedding_graph", _LABEL_RE.search(cypher).group(1)
+    if "RETURN c.centroid_embedding AS centroid_embedding" in cypher:
+        return "centroid", None
+    if "MERGE (c:" in cypher and "status = 'proposed'" in cypher:
+        return "merge_cluster", None
+    if "MERGE (d:" in cypher and "d.kind = 'concept_drift'" in cypher:
+        return "merge_drift", None
+    if "MERGE (d)-[:" in cypher:
+        return "merge_drift_edge", None
+    if "MERGE (e)-[r:" in cypher or ("MERGE (p)-[r:" in cypher and "CANDIDATE_INSTANCE_OF" in cypher):
+        return "merge_edge", None
+    raise AssertionError(f"Unexpected query: {cypher}")
 
 
 class FakeNeo4jClient:
@@ -30,76 +52,40 @@ class FakeNeo4jClient:
                 "c4": {"id": "c4", "embedding_graph": [0.0, 0.95, 0.1]},
             },
         }
+        # Embedding query results per (kind, label), built once since the nodes never change.
+        self._embedding_rows: dict[tuple[str, str], tuple[dict, ...]] = {
+            (kind, label): tuple(
+                {"id": node_id, "embedding": node[kind]}
+                for node_id, node in sorted(nodes.items())
+                if kind in node
+            )
+            for label, nodes in self.nodes.items()
+            for kind in ("embedding_text", "embedding_graph")
+        }
         self.cluster_nodes: dict[str, dict] = {}
         self.cluster_edges: list[dict] = []
         self.drift_reviews: list[dict] = []
 
     def run(self, cypher: str, params: dict | None = None):
         params = params or {}
-        if "RETURN n.id AS id, n.embedding_text AS embedding" in cypher:
-            label = cypher.split("MATCH (n:", 1)[1].split(")", 1)[0]
-            return [
-                {"id": node_id, "embedding": node["embedding_text"]}
-                for node_id, node in sorted(self.nodes.get(label, {}).items())
-            ]
-        if "RETURN n.id AS id, n.embedding_graph AS embedding" in cypher:
-            label = cypher.split("MATCH (n:", 1)[1].split(")", 1)[0]
-            return [
-                {"id": node_id, "embedding": node["embedding_graph"]}
-                for node_id, node in sorted(self.nodes.get(label, {}).items())
-            ]
-        if "RETURN c.centroid_embedding AS centroid_embedding" in cypher:
+        kind, label = _parse(cypher)
+        if label is not None:
+            return [dict(row) for row in self._embedding_rows.get((kind, label), ())]
+        if kind == "centroid":
             concept = self.cluster_nodes.get(params["concept_id"])
             return [{"centroid_embedding": concept.get("centroid_embedding")}] if concept else []
-        if "MERGE (c:" in cypher and "status = 'proposed'" in cypher:
+        if kind == "merge_cluster":
             self.cluster_nodes[params["id"]] = dict(params)
-            return []
-        if "MERGE (d:" in cypher and "d.kind = 'concept_drift'" in cypher:
+        elif kind == "merge_drift":
             self.drift_reviews.append(dict(params))
-            return []
-        if "MERGE (d)-[:" in cypher:
-            return []
-        if "MERGE (e)-[r:" in cypher:
-            self.cluster_edges.append(dict(params))
-            return []
-        if "MERGE (p)-[r:" in cypher and "CANDIDATE_INSTANCE_OF" in cypher:
+        elif kind == "merge_edge":
             self.cluster_edges.append(dict(params))
-            return []
-        raise AssertionError(f"Unexpected query: {cypher}")
-
-
-def _schema_store(tmp_path: Path) -> SchemaStore:
-    node_types = tmp_path / "node_types.yml"
-    rel_types = tmp_path / "relationship_types.yml"
-    rules = tmp_path / "rules.yml"
-    version = tmp_path / "version.yml"
-
-    node_types.write_text(
-        "node_types:\n"
-        "  Concept:\n"
-        "    properties: [name, embedding_graph]\n"
-        "  Particular:\n"
-        "    properties: [name, embedding_text]\n"
-        "  Interaction:\n"
-        "    properties: [summary, embedding_text]\n"
-    )
-    rel_types.write_text("relationship_types: {}\n")
-    rules.write_text(
-        "schema_conventions:\n"
-        "  concept_label: Concept\n"
-        "  particular_label: Particular\n"
-        "  interaction_label: Interaction\n"
-        "  candidate_instance_of_relationship: CANDIDATE_INSTANCE_OF\n"
-        "  in_cluster_relationship: IN_CLUSTER\n"
-    )
-    version.write_text("version: 1\nlast_updated: null\n")
-    return SchemaStore(node_types, rel_types, rules, version, mutable=True)
+        return []
 
 
-def test_clustering_service_creates_hypothesis_clusters(tmp_path: Path) -> None:
+def test_clustering_service_creates_hypothesis_clusters(concept_schema_store: SchemaStore) -> None:
     client = FakeNeo4jClient()
-    store = _schema_store(tmp_path)
-    service = ClusteringService(client=client, schema_store=store)
+    service = ClusteringService(client=client, schema_store=concept_schema_store)
 
     result = service.run(updated_at=datetime(2024, 1, 5, tzinfo=timezone.utc))
 
@@ -112,7 +98,7 @@ def test_clustering_service_creates_hypothesis_clusters(tmp_path: Path) -> None:
 
 def test_clustering_service_records_dynamic_schema_types(tmp_path: Path) -> None:
     client = FakeNeo4jClient()
-    store = _schema_store(tmp_path)
+    store = build_concept_schema_store(tmp_path)
     service = ClusteringService(client=client, schema_store=store)
 
     service.run(run_hdbscan=True, run_leiden=False, updated_at=datetime(2024, 4, 1, tzinfo=timezone.utc))
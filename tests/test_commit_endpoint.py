@@ -1,10 +1,7 @@
-import pathlib
-import sys
+import copy
 from datetime import datetime, timezone
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
-from fastapi.testclient import TestClient
+import pytest
 
 from logos import app_state, main
 from logos.api.routes import ingest as ingest_routes
@@ -34,50 +31,75 @@ class DummyClient:
         self.queries.append((cypher, params or {}))
         return []
 
+    def reset(self) -> None:
+        self.tx.calls.clear()
+        self.queries.clear()
+
+
+@pytest.fixture(scope="module")
+def _module_dummy_client() -> DummyClient:
+    return DummyClient()
 
-def _seed_preview():
-    main.PENDING_INTERACTIONS["i1"] = {
-        "interaction": {
-            "id": "i1",
-            "type": "email",
-            "at": datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat(),
-            "sentiment": 0.0,
-            "summary": "hello",
-            "source_uri": "uri",
-        },
-        "entities": {
-            "orgs": [{"id": "org1", "name": "Acme"}],
-            "persons": [{"id": "p1", "name": "Alice", "org_id": "org1"}],
-            "projects": [{"id": "proj1", "name": "Project One"}],
-            "contracts": [{"id": "ct1", "name": "Contract", "org_ids": ["org1"]}],
-            "topics": ["Topic A"],
-            "commitments": [
-                {
-                    "id": "c1",
-                    "text": "Do it",
-                    "person_id": "p1",
-                    "relates_to_project_id": "proj1",
-                }
-            ],
-        },
-        "relationships": [
-            {"src": "p1", "dst": "proj1", "rel": "INVOLVED_IN"},
-            {"src": "i1", "dst": "p1", "rel": "MENTIONS"},
-        ],
-    }
 
+@pytest.fixture
+def dummy_client(_module_dummy_client, monkeypatch):
+    """Module-wide DummyClient wired into the ingest routes and reset after each test."""
 
-def test_commit_endpoint_runs_upsert_bundle(monkeypatch, tmp_path):
-    client = TestClient(main.app)
-    dummy_client = DummyClient()
-    monkeypatch.setattr(ingest_routes, "get_client", lambda: dummy_client)
-    tmp_schema = SchemaStore(
+    monkeypatch.setattr(ingest_routes, "get_client", lambda: _module_dummy_client)
+    yield _module_dummy_client
+    _module_dummy_client.reset()
+
+
+@pytest.fixture
+def tmp_schema_store(monkeypatch, tmp_path) -> SchemaStore:
+    """Point the commit stages at an empty schema store under ``tmp_path``."""
+
+    store = SchemaStore(
         tmp_path / "node_types.yml",
         tmp_path / "relationship_types.yml",
         tmp_path / "rules.yml",
         tmp_path / "version.yml",
     )
-    monkeypatch.setattr(stages, "SCHEMA_STORE", tmp_schema)
+    monkeypatch.setattr(stages, "SCHEMA_STORE", store)
+    return store
+
+
+SEED_PREVIEW_TEMPLATE = {
+    "interaction": {
+        "id": "i1",
+        "type": "email",
+        "at": datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat(),
+        "sentiment": 0.0,
+        "summary": "hello",
+        "source_uri": "uri",
+    },
+    "entities": {
+        "orgs": [{"id": "org1", "name": "Acme"}],
+        "persons": [{"id": "p1", "name": "Alice", "org_id": "org1"}],
+        "projects": [{"id": "proj1", "name": "Project One"}],
+        "contracts": [{"id": "ct1", "name": "Contract", "org_ids": ["org1"]}],
+        "topics": ["Topic A"],
+        "commitments": [
+            {
+                "id": "c1",
+                "text": "Do it",
+                "person_id": "p1",
+                "relates_to_project_id": "proj1",
+            }
+        ],
+    },
+    "relationships": [
+        {"src": "p1", "dst": "proj1", "rel": "INVOLVED_IN"},
+        {"src": "i1", "dst": "p1", "rel": "MENTIONS"},
+    ],
+}
+
+
+def _seed_preview():
+    main.PENDING_INTERACTIONS["i1"] = copy.deepcopy(SEED_PREVIEW_TEMPLATE)
+
+
+def test_commit_endpoint_runs_upsert_bundle(client, dummy_client, tmp_schema_store):
     _seed_preview()
 
     response = client.post("/commit/i1")
@@ -91,17 +113,13 @@ def test_commit_endpoint_runs_upsert_bundle(monkeypatch, tmp_path):
     assert "i1" not in main.PENDING_INTERACTIONS
 
 
-def test_commit_endpoint_returns_404_for_missing_preview():
-    client = TestClient(main.app)
+def test_commit_endpoint_returns_404_for_missing_preview(client):
     response = client.post("/commit/unknown")
     assert response.status_code == 404
     assert response.json() == {"detail": "interaction not found"}
 
 
-def test_commit_broadcasts_updates(monkeypatch):
-    client = TestClient(main.app)
-    dummy_client = DummyClient()
-    monkeypatch.setattr(ingest_routes, "get_client", lambda: dummy_client)
+def test_commit_broadcasts_updates(client, dummy_client):
     _seed_preview()
 
     with client.websocket_connect("/ws/updates") as websocket:
@@ -114,19 +132,9 @@ def test_commit_broadcasts_updates(monkeypatch):
     assert message["summary"]["persons"] == 1
 
 
-def test_commit_api_endpoint_accepts_preview_bundle(monkeypatch, tmp_path):
-    client = TestClient(main.app)
-    dummy_client = DummyClient()
-    monkeypatch.setattr(ingest_routes, "get_client", lambda: dummy_client)
-    tmp_schema = SchemaStore(
-        tmp_path / "node_types.yml",
-        tmp_path / "relationship_types.yml",
-        tmp_path / "rules.yml",
-        tmp_path / "version.yml",
-    )
-    monkeypatch.setattr(stages, "SCHEMA_STORE", tmp_schema)
-    staging_store = LocalStagingStore(tmp_path / "staging")
-    monkeypatch.setattr(app_state, "STAGING_STORE", staging_store)
+@pytest.fixture(scope="module")
+def i2_preview_bundle() -> tuple[PreviewBundle, dict]:
+    """The i2 preview bundle and its JSON payload, serialised once per module."""
 
     meta = InteractionMeta(
         interaction_id="i2",
@@ -135,8 +143,7 @@ def test_commit_api_endpoint_accepts_preview_bundle(monkeypatch, tmp_path):
         source_type="text",
         created_by="api",
     )
-    staging_store.create_interaction(meta)
-    preview_bundle = PreviewBundle(
+    bundle = PreviewBundle(
         meta=meta,
         interaction={
             "id": "i2",
@@ -152,13 +159,21 @@ def test_commit_api_endpoint_accepts_preview_bundle(monkeypatch, tmp_path):
         },
         relationships=[{"src": "i2", "dst": "p1", "rel": "MENTIONS"}],
     )
-    staging_store.save_preview(meta.interaction_id, preview_bundle)
-    staging_store.set_state(meta.interaction_id, "preview_ready")
+    return bundle, bundle.model_dump(mode="json")
 
-    response = client.post(
-        "/api/v1/interactions/i2/commit",
-        json=preview_bundle.model_dump(mode="json"),
-    )
+
+def test_commit_api_endpoint_accepts_preview_bundle(
+    client, dummy_client, tmp_schema_store, i2_preview_bundle, monkeypatch, tmp_path
+):
+    preview_bundle, payload = i2_preview_bundle
+    staging_store = LocalStagingStore(tmp_path / "staging")
+    monkeypatch.setattr(app_state, "STAGING_STORE", staging_store)
+
+    staging_store.create_interaction(preview_bundle.meta)
+    staging_store.save_preview(preview_bundle.meta.interaction_id, preview_bundle)
+    staging_store.set_state(preview_bundle.meta.interaction_id, "preview_ready")
+
+    response = client.post("/api/v1/interactions/i2/commit", json=payload)
 
     assert response.status_code == 200
     body = response.json()
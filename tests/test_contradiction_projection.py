@@ -1,10 +1,5 @@
 from __future__ import annotations
 
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from logos.contradictions.models import BeliefPointer, ContradictionRecord
 from logos.contradictions.projection import ContradictionProjection
 
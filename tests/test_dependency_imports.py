@@ -1,4 +1,4 @@
-import importlib
+from importlib.util import find_spec
 
 
 def test_runtime_dependencies_importable():
@@ -11,5 +11,6 @@ def test_runtime_dependencies_importable():
         "neo4j",
     ]
 
-    loaded = [importlib.import_module(module) for module in modules]
-    assert all(module is not None for module in loaded)
+    # find_spec locates each package without running its __init__ (uvicorn/neo4j are heavy).
+    missing = [module for module in modules if find_spec(module) is None]
+    assert missing == []
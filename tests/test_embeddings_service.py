@@ -1,17 +1,34 @@
 from __future__ import annotations
 
+import functools
+import re
 from datetime import datetime, timezone
-from pathlib import Path
+from types import MappingProxyType
 
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+import pytest
 
 from logos.graphio.schema_store import SchemaStore
 from logos.services.embeddings import EmbeddingService, LocalSentenceEmbeddingBackend, Node2VecGraphEmbeddingBackend
 
 
+_LABEL_RE = re.compile(r"MATCH \(n:(\w+)")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse(cypher: str) -> tuple[str, str | None]:
+    """Classify a query once into ``(kind, label)``; repeat queries hit the cache."""
+
+    match = _LABEL_RE.search(cypher)
+    label = match.group(1) if match else None
+    if "RETURN n.id AS id, properties(n) AS props" in cypher:
+        return "read_nodes", label
+    if "RETURN a.id AS src, b.id AS dst" in cypher:
+        return "read_edges", None
+    if cypher.startswith("UNWIND $rows AS row") and "SET n.embedding" in cypher and label:
+        return "write_embedding", label
+    raise AssertionError(f"Unexpected query: {cypher}")
+
+
 class FakeNeo4jClient:
     def __init__(self) -> None:
         self.nodes: dict[str, dict[str, dict]] = {
@@ -27,69 +44,60 @@ class FakeNeo4jClient:
                 "i1": {"id": "i1", "summary": "Weekly sync about project risk"},
             },
         }
+        # Node ids never change here, so each label's id column is sorted once.
+        self.sorted_ids: dict[str, tuple[str, ...]] = {label: tuple(sorted(nodes)) for label, nodes in self.nodes.items()}
         self.concept_edges = [("c1", "c2"), ("c2", "c3")]
         self.write_calls: list[tuple[str, dict]] = []
 
     def run(self, cypher: str, params: dict | None = None):
         params = params or {}
-        if "RETURN n.id AS id, properties(n) AS props" in cypher:
-            label = cypher.split("MATCH (n:", 1)[1].split(")", 1)[0]
-            return [
-                {"id": node_id, "props": dict(props)}
-                for node_id, props in sorted(self.nodes.get(label, {}).items())
-            ]
-        if "RETURN a.id AS src, b.id AS dst" in cypher:
+        kind, label = _parse(cypher)
+        if kind == "read_nodes":
+            nodes = self.nodes.get(label, {})
+            return [{"id": node_id, "props": MappingProxyType(nodes[node_id])} for node_id in self.sorted_ids.get(label, ())]
+        if kind == "read_edges":
             return [{"src": src, "dst": dst} for src, dst in self.concept_edges]
-        if "SET n.embedding" in cypher:
-            label = cypher.split("MATCH (n:", 1)[1].split(" ", 1)[0]
-            node_id = params["id"]
-            node = self.nodes[label][node_id]
+        # Writes are batched: one UNWIND query per label and embedding field.
+        for row in params["rows"]:
+            node = self.nodes[label][row["id"]]
             if "embedding_text" in cypher:
-                node["embedding_text"] = params["embedding"]
+                node["embedding_text"] = row["embedding"]
                 node["embedding_text_model"] = params["embedding_model"]
             if "embedding_graph" in cypher:
-                node["embedding_graph"] = params["embedding"]
+                node["embedding_graph"] = row["embedding"]
                 node["embedding_graph_model"] = params["embedding_model"]
             node["embedding_model"] = params["embedding_model"]
             node["embedding_model_version"] = params["embedding_model_version"]
-            node["content_hash"] = params["content_hash"]
+            node["content_hash"] = row["content_hash"]
             if "embedding_text_content_hash" in cypher:
-                node["embedding_text_content_hash"] = params["content_hash"]
+                node["embedding_text_content_hash"] = row["content_hash"]
             if "embedding_graph_content_hash" in cypher:
-                node["embedding_graph_content_hash"] = params["content_hash"]
+                node["embedding_graph_content_hash"] = row["content_hash"]
             node["embedding_updated_at"] = params["embedding_updated_at"]
-            self.write_calls.append((cypher, params))
-            return []
-        raise AssertionError(f"Unexpected query: {cypher}")
-
-
-def _schema_store(tmp_path: Path) -> SchemaStore:
-    node_types = tmp_path / "node_types.yml"
-    rel_types = tmp_path / "relationship_types.yml"
-    rules = tmp_path / "rules.yml"
-    version = tmp_path / "version.yml"
-
-    node_types.write_text(
-        "node_types:\n"
-        "  Concept:\n"
-        "    properties: [name, kind]\n"
-        "  Person:\n"
-        "    properties: [name, title]\n"
-        "  Interaction:\n"
-        "    properties: [summary]\n"
+        self.write_calls.append((cypher, params))
+        return []
+
+
+@pytest.fixture(scope="session")
+def embedding_schema_store() -> SchemaStore:
+    # EmbeddingService only reads node types and conventions and never records any, so one store is shared.
+    return SchemaStore.from_mapping(
+        {
+            "Concept": {"properties": ["name", "kind"]},
+            "Person": {"properties": ["name", "title"]},
+            "Interaction": {"properties": ["summary"]},
+        },
+        {},
+        {"schema_conventions": {"concept_label": "Concept"}},
+        {"version": 1, "last_updated": None},
     )
-    rel_types.write_text("relationship_types: {}\n")
-    rules.write_text("schema_conventions:\n  concept_label: Concept\n")
-    version.write_text("version: 1\nlast_updated: null\n")
-    return SchemaStore(node_types, rel_types, rules, version, mutable=False)
 
 
-def test_embedding_service_writes_text_and_graph_embeddings(tmp_path: Path) -> None:
+def test_embedding_service_writes_text_and_graph_embeddings(embedding_schema_store: SchemaStore) -> None:
     client = FakeNeo4jClient()
-    store = _schema_store(tmp_path)
     service = EmbeddingService(
         client=client,
-        schema_store=store,
+        schema_store=embedding_schema_store,
         text_backend=LocalSentenceEmbeddingBackend(dimensions=12),
         graph_backend=Node2VecGraphEmbeddingBackend(dimensions=12, seed=7),
     )
@@ -98,6 +106,8 @@ def test_embedding_service_writes_text_and_graph_embeddings(tmp_path: Path) -> N
 
     assert result["text_embeddings_updated"] == 5
     assert result["graph_embeddings_updated"] == 3
+    # One batched write per label for text embeddings plus one for concept graph embeddings.
+    assert len(client.write_calls) == 4
     assert "embedding_text" in client.nodes["Person"]["p1"]
     assert "embedding_text" in client.nodes["Interaction"]["i1"]
     assert "embedding_graph" in client.nodes["Concept"]["c1"]
@@ -106,12 +116,11 @@ def test_embedding_service_writes_text_and_graph_embeddings(tmp_path: Path) -> N
     assert "embedding_model_version" in client.nodes["Concept"]["c1"]
 
 
-def test_embedding_service_is_idempotent_for_fixed_seed(tmp_path: Path) -> None:
+def test_embedding_service_is_idempotent_for_fixed_seed(embedding_schema_store: SchemaStore) -> None:
     client = FakeNeo4jClient()
-    store = _schema_store(tmp_path)
     service = EmbeddingService(
         client=client,
-        schema_store=store,
+        schema_store=embedding_schema_store,
         text_backend=LocalSentenceEmbeddingBackend(dimensions=10),
         graph_backend=Node2VecGraphEmbeddingBackend(dimensions=10, seed=19),
     )
@@ -128,12 +137,11 @@ def test_embedding_service_is_idempotent_for_fixed_seed(tmp_path: Path) -> None:
     assert len(client.write_calls) == writes_after_first
 
 
-def test_text_embedding_changes_only_when_text_hash_changes(tmp_path: Path) -> None:
+def test_text_embedding_changes_only_when_text_hash_changes(embedding_schema_store: SchemaStore) -> None:
     client = FakeNeo4jClient()
-    store = _schema_store(tmp_path)
     service = EmbeddingService(
         client=client,
-        schema_store=store,
+        schema_store=embedding_schema_store,
         text_backend=LocalSentenceEmbeddingBackend(dimensions=10),
         graph_backend=Node2VecGraphEmbeddingBackend(dimensions=10, seed=11),
     )
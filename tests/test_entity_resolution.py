@@ -1,37 +1,43 @@
+import copy
+from collections import deque
+
 from logos.normalise.resolution import GraphEntityResolver, reassign_preview_identities, resolve_preview_from_graph
 
 
+_BASE_PREVIEW = {
+    "entities": {
+        "orgs": [{"id": "org_temp", "name": "Acme Pty Ltd", "domain": "acme.com"}],
+        "persons": [
+            {
+                "id": "p_temp",
+                "name": "Alice Smith",
+                "email": "alice@acme.com",
+                "org_id": "org_temp",
+            }
+        ],
+        "projects": [{"id": "proj_temp", "name": "Apollo"}],
+    },
+    "relationships": [
+        {"src": "p_temp", "dst": "org_temp", "rel": "WORKS_FOR"},
+        {"src": "proj_temp", "dst": "org_temp", "rel": "RELATED_TO"},
+    ],
+}
+
+
 class StubClient:
     def __init__(self, responses):
-        self.responses = list(responses)
+        self.responses = deque(responses)
         self.calls: list[tuple[str, dict]] = []
 
     def run(self, cypher: str, params=None):
         self.calls.append((cypher, params or {}))
         if self.responses:
-            return self.responses.pop(0)
+            return self.responses.popleft()
         return []
 
 
 def test_resolve_preview_updates_entities_and_relationships():
-    preview = {
-        "entities": {
-            "orgs": [{"id": "org_temp", "name": "Acme Pty Ltd", "domain": "acme.com"}],
-            "persons": [
-                {
-                    "id": "p_temp",
-                    "name": "Alice Smith",
-                    "email": "alice@acme.com",
-                    "org_id": "org_temp",
-                }
-            ],
-            "projects": [{"id": "proj_temp", "name": "Apollo"}],
-        },
-        "relationships": [
-            {"src": "p_temp", "dst": "org_temp", "rel": "WORKS_FOR"},
-            {"src": "proj_temp", "dst": "org_temp", "rel": "RELATED_TO"},
-        ],
-    }
+    preview = copy.deepcopy(_BASE_PREVIEW)
 
     responses = [
         [
@@ -1,11 +1,7 @@
 import asyncio
-import pathlib
-import sys
 
 import pytest
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from logos.events.bus import InMemoryEventBus
 from logos.events.types import EventEnvelope
 
@@ -1,13 +1,9 @@
 import asyncio
 import json
-import pathlib
-import sys
 from collections.abc import Mapping
 
 import pytest
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from logos.events.redis_streams import RedisStreamsEventBus
 from logos.events.types import EventEnvelope
 
@@ -1,110 +1,153 @@
 from __future__ import annotations
 
-import pathlib
+import bisect
+import functools
 import re
-import sys
+from types import MappingProxyType
 from typing import Any
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+import orjson
 
-from fastapi.testclient import TestClient
-
-from logos import main
 from logos.api.routes import ingest as ingest_routes
 from logos.core import pipeline_executor
+from tests._helpers import json_of
 
 
-_LABEL_RE = re.compile(r"\(n:([A-Za-z0-9_]+)")
-
-
-class FakeTx:
-    def __init__(self, graph: "FakeGraphClient") -> None:
-        self.graph = graph
-
-    def run(self, cypher: str, params: dict[str, Any] | None = None):
-        return self.graph.run(cypher, params)
-
-
+# Stores params and embeddings by reference: the pipeline builds fresh params per
+# query and never mutates them after run() returns.
 class FakeGraphClient:
     def __init__(self) -> None:
         self.nodes: dict[str, dict[str, dict[str, Any]]] = {}
+        # Per-label id column kept sorted on insert, so reads never re-sort.
+        self.sorted_ids: dict[str, list[str]] = {}
+        # First id written per label, for direct lookups in assertions.
+        self.first_ids: dict[str, str] = {}
         self.relationships: list[tuple[str, dict[str, Any]]] = []
 
+    def _node(self, label: str, node_id: str) -> dict[str, Any]:
+        nodes = self.nodes.setdefault(label, {})
+        if node_id not in nodes:
+            nodes[node_id] = {}
+            self.first_ids.setdefault(label, node_id)
+            bisect.insort(self.sorted_ids.setdefault(label, []), node_id)
+        return nodes[node_id]
+
     def run_in_tx(self, fn) -> None:
-        fn(FakeTx(self))
+        # The client's own ``run`` matches the transaction API, so it doubles as the tx.
+        fn(self)
 
     def run(self, cypher: str, params: dict[str, Any] | None = None):
         params = params or {}
+        kind, label, field = _parse(cypher)
 
-        if "MERGE (n:" in cypher and "SET n += $props" in cypher:
-            label = _extract_label(cypher)
+        if kind == "merge_node":
             node_id = str(params.get("id") or "")
             if label and node_id:
-                props = dict(params.get("props") or {})
-                props.setdefault("id", node_id)
-                self.nodes.setdefault(label, {}).setdefault(node_id, {}).update(props)
+                node = self._node(label, node_id)
+                node.update(params.get("props") or {})
+                node.setdefault("id", node_id)
             return []
 
-        if "MATCH (n:" in cypher and "RETURN n.id AS id, properties(n) AS props" in cypher:
-            label = _extract_label(cypher)
+        if kind == "read_nodes":
             if not label:
                 return []
+            nodes = self.nodes.get(label, {})
+            return [{"id": node_id, "props": MappingProxyType(nodes[node_id])} for node_id in self.sorted_ids.get(label, ())]
+
+        if kind == "read_embeddings":
+            if not (label and field):
+                return []
+            nodes = self.nodes.get(label, {})
             return [
-                {"id": node_id, "props": dict(props)}
-                for node_id, props in sorted(self.nodes.get(label, {}).items())
+                {"id": node_id, "embedding": nodes[node_id][field]}
+                for node_id in self.sorted_ids.get(label, ())
+                if field in nodes[node_id]
             ]
 
-        if "MATCH (n:" in cypher and "AS embedding" in cypher and "RETURN n.id AS id" in cypher:
-            label = _extract_label(cypher)
-            field_match = re.search(r"n\.([A-Za-z0-9_]+) AS embedding", cypher)
-            field = field_match.group(1) if field_match else None
-            rows: list[dict[str, Any]] = []
-            if label and field:
-                for node_id, props in sorted(self.nodes.get(label, {}).items()):
-                    if field in props:
-                        rows.append({"id": node_id, "embedding": props[field]})
-            return rows
-
-        if "MATCH (n:" in cypher and "SET n.embedding_" in cypher:
-            label = _extract_label(cypher)
-            node_id = str(params.get("id") or "")
-            if label and node_id:
-                node = self.nodes.setdefault(label, {}).setdefault(node_id, {"id": node_id})
-                for key, value in params.items():
-                    if key in {"embedding", "embedding_model", "embedding_model_version", "content_hash", "embedding_updated_at"}:
-                        continue
+        if kind == "write_embedding":
+            for row in params.get("rows") or ():
+                node_id = str(row.get("id") or "")
+                if not (label and node_id):
+                    continue
+                node = self._node(label, node_id)
+                node.setdefault("id", node_id)
                 if "embedding_text" in cypher:
-                    node["embedding_text"] = list(params.get("embedding") or [])
+                    node["embedding_text"] = row.get("embedding") or ()
                 if "embedding_graph" in cypher:
-                    node["embedding_graph"] = list(params.get("embedding") or [])
+                    node["embedding_graph"] = row.get("embedding") or ()
                 node["embedding_model"] = params.get("embedding_model")
             return []
 
-        if "MERGE (c:" in cypher or "MERGE (e)-[r:" in cypher:
-            self.relationships.append((cypher, dict(params)))
-            return []
-
+        if kind == "merge_cluster":
+            self.relationships.append((cypher, params))
         return []
 
 
-def _extract_label(cypher: str) -> str | None:
-    match = _LABEL_RE.search(cypher)
-    return match.group(1) if match else None
-
-
-def test_ingest_commit_persists_embeddings_and_assignment_evidence(monkeypatch) -> None:
+_LABEL_RE = re.compile(r"\(n:([A-Za-z0-9_]+)")
+_EMBEDDING_FIELD_RE = re.compile(r"n\.([A-Za-z0-9_]+) AS embedding")
+
+
+@functools.lru_cache(maxsize=128)
+def _parse(cypher: str) -> tuple[str, str | None, str | None]:
+    """Classify a query once into ``(kind, label, embedding_field)``; repeats hit the cache."""
+
+    label_match = _LABEL_RE.search(cypher)
+    label = label_match.group(1) if label_match else None
+    if "MERGE (n:" in cypher and "SET n += $props" in cypher:
+        return "merge_node", label, None
+    if "MATCH (n:" in cypher:
+        if "RETURN n.id AS id, properties(n) AS props" in cypher:
+            return "read_nodes", label, None
+        if "AS embedding" in cypher and "RETURN n.id AS id" in cypher:
+            field_match = _EMBEDDING_FIELD_RE.search(cypher)
+            return "read_embeddings", label, field_match.group(1) if field_match else None
+        if "SET n.embedding_" in cypher:
+            return "write_embedding", label, None
+    if "MERGE (c:" in cypher or "MERGE (e)-[r:" in cypher:
+        return "merge_cluster", None, None
+    return "ignored", None, None
+
+
+# Fixed 24-d embedding that places the person next to the community-representative concept.
+_PERSON_EMBEDDING = (
+    0.2339694677804886,
+    -0.17953361845348462,
+    0.2957332199015125,
+    -0.006804481165875514,
+    0.30620165246439784,
+    -0.08427088213122744,
+    -0.06228717374916809,
+    -0.17639308868461895,
+    0.24234421383079693,
+    -0.07484929282463058,
+    -0.0915987849252473,
+    0.2925926901326469,
+    -0.12405092587019194,
+    0.2318757812679116,
+    0.11148880679472947,
+    -0.044490838392262914,
+    -0.34179432317820824,
+    0.16906518589059918,
+    0.10730143376957534,
+    -0.4527597083447935,
+    -0.1680183426343106,
+    0.0926456281815358,
+    -0.20256417009183245,
+    0.08950509841267014,
+)
+
+
+def test_ingest_commit_persists_embeddings_and_assignment_evidence(client, monkeypatch) -> None:
     fake_graph = FakeGraphClient()
     monkeypatch.setattr(ingest_routes, "get_client", lambda: fake_graph)
     monkeypatch.setattr(pipeline_executor.OntologyIntegrityGuard, "validate", lambda self, bundle, context=None: None)
 
-    client = TestClient(main.app)
-
     ingest_response = client.post(
         "/api/v1/ingest/text",
         json={"text": "Jordan shared a governance update with the city council."},
     )
     assert ingest_response.status_code == 200
-    payload = ingest_response.json()
+    payload = json_of(ingest_response)
 
     preview = payload["preview"]
     preview.setdefault("entities", {})
@@ -113,42 +156,16 @@ def test_ingest_commit_persists_embeddings_and_assignment_evidence(monkeypatch)
         preview["entities"]["persons"].append({"id": "person_trace_1", "name": "Jordan"})
     person = preview["entities"]["persons"][0]
     person["hints"] = {"stakeholder_type": "novel oversight counterpart"}
-    person["embedding"] = [
-        0.2339694677804886,
-        -0.17953361845348462,
-        0.2957332199015125,
-        -0.006804481165875514,
-        0.30620165246439784,
-        -0.08427088213122744,
-        -0.06228717374916809,
-        -0.17639308868461895,
-        0.24234421383079693,
-        -0.07484929282463058,
-        -0.0915987849252473,
-        0.2925926901326469,
-        -0.12405092587019194,
-        0.2318757812679116,
-        0.11148880679472947,
-        -0.044490838392262914,
-        -0.34179432317820824,
-        0.16906518589059918,
-        0.10730143376957534,
-        -0.4527597083447935,
-        -0.1680183426343106,
-        0.0926456281815358,
-        -0.20256417009183245,
-        0.08950509841267014,
-    ]
-
-
+    person["embedding"] = list(_PERSON_EMBEDDING)
 
     commit_response = client.post(
         f"/api/v1/interactions/{payload['interaction_id']}/commit",
-        json=preview,
+        content=orjson.dumps(preview),
+        headers={"content-type": "application/json"},
     )
     assert commit_response.status_code == 200
 
-    person_node = next(iter(fake_graph.nodes.get("Person", {}).values()))
+    person_node = fake_graph.nodes["Person"][fake_graph.first_ids["Person"]]
     assert person_node.get("embedding_text")
 
     assignment = person_node.get("hint_resolution", {}).get("stakeholder_types")
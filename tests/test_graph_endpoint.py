@@ -1,16 +1,7 @@
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
-from fastapi.testclient import TestClient
-
 from logos import main
 
 
-def test_ego_graph_returns_expected_keys(monkeypatch):
-    client = TestClient(main.app)
-
+def test_ego_graph_returns_expected_keys(client, monkeypatch):
     fake_result = [
         {
             "pnodes": [{"id": "p1"}],
@@ -1,10 +1,3 @@
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
-from fastapi.testclient import TestClient
-
 from logos import main
 from logos.graphio import neo4j_client
 
@@ -17,17 +10,15 @@ def _down(monkeypatch):
     monkeypatch.setattr(neo4j_client, "_get_client", _raise)
 
 
-def test_health_reports_down_when_no_driver(monkeypatch):
+def test_health_reports_down_when_no_driver(client, monkeypatch):
     _down(monkeypatch)
-    client = TestClient(main.app)
     resp = client.get("/health")
     assert resp.status_code == 200
     assert resp.json() == {"neo4j": "down", "reason": "neo4j_unavailable"}
 
 
-def test_commit_returns_503_when_graph_down(monkeypatch):
+def test_commit_returns_503_when_graph_down(client, monkeypatch):
     _down(monkeypatch)
-    client = TestClient(main.app)
     main.PENDING_INTERACTIONS["i1"] = {
         "interaction": {
             "id": "i1",
@@ -44,9 +35,8 @@ def test_commit_returns_503_when_graph_down(monkeypatch):
     assert resp.json() == {"error": "neo4j_unavailable"}
 
 
-def test_search_returns_503_when_graph_down(monkeypatch):
+def test_search_returns_503_when_graph_down(client, monkeypatch):
     _down(monkeypatch)
-    client = TestClient(main.app)
     resp = client.get("/search?q=x")
     assert resp.status_code == 503
     assert resp.json() == {"error": "neo4j_unavailable"}
@@ -1,15 +1,30 @@
+import functools
+import os
 from importlib.util import find_spec
 from pathlib import Path
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 LOGOS_ROOT = REPO_ROOT / "logos"
+_INDEXED_NAMES = ("logos_hcg", "upsert.py", "schema_store.py")
+
+
+@functools.cache
+def _path_index() -> dict[str, list[Path]]:
+    """Walk ``LOGOS_ROOT`` once and collect every file or directory with an indexed name."""
+
+    index: dict[str, list[Path]] = {name: [] for name in _INDEXED_NAMES}
+    for root, dirnames, filenames in os.walk(LOGOS_ROOT):
+        for name in (*dirnames, *filenames):
+            if name in index:
+                index[name].append(Path(root) / name)
+    return index
 
 
 def test_no_legacy_hcg_package_present() -> None:
     """Ensure the legacy logos_hcg client is not part of the codebase."""
 
-    legacy_dirs = list(LOGOS_ROOT.rglob("logos_hcg"))
+    legacy_dirs = _path_index()["logos_hcg"]
     assert not legacy_dirs, f"Found unexpected legacy logos_hcg paths: {legacy_dirs}"
     assert find_spec("logos_hcg") is None
 
@@ -17,8 +32,15 @@ def test_no_legacy_hcg_package_present() -> None:
 def test_single_graphio_upsert_and_schema_store() -> None:
     """Only the canonical GraphIO implementations should exist."""
 
-    upsert_files = list(LOGOS_ROOT.rglob("upsert.py"))
-    schema_store_files = list(LOGOS_ROOT.rglob("schema_store.py"))
+    index = _path_index()
+
+    assert index["upsert.py"] == [LOGOS_ROOT / "graphio" / "upsert.py"]
+    assert index["schema_store.py"] == [LOGOS_ROOT / "graphio" / "schema_store.py"]
+
+
+def test_test_module_names_are_unique() -> None:
+    """Duplicate test module stems would be collected (and run) twice."""
 
-    assert upsert_files == [LOGOS_ROOT / "graphio" / "upsert.py"]
-    assert schema_store_files == [LOGOS_ROOT / "graphio" / "schema_store.py"]
+    stems = sorted(path.stem for path in (REPO_ROOT / "tests").rglob("test_*.py"))
+    duplicates = sorted({stem for stem in stems if stems.count(stem) > 1})
+    assert not duplicates, f"Found duplicate test modules: {duplicates}"
@@ -1,28 +1,16 @@
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
-import asyncio
-import httpx
-from unittest.mock import Mock, patch
+import pytest
 
 from logos import main
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-async def _post_audio(payload: dict) -> httpx.Response:
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=main.app), base_url="http://test"
-    ) as client:
-        return await client.post("/ingest/audio", json=payload)
+_AUDIO_PAYLOAD = {"source_uri": "file://audio.wav"}
 
 
-def test_ingest_audio_success() -> None:
-    async def _run() -> httpx.Response:
-        with patch("logos.main.transcribe", new=Mock(return_value={"text": "hello world"})):
-            return await _post_audio({"source_uri": "file://audio.wav"})
+async def test_ingest_audio_success(asgi_client, monkeypatch) -> None:
+    monkeypatch.setattr(main, "transcribe", lambda *args, **kwargs: {"text": "hello world"})
+    response = await asgi_client.post("/ingest/audio", json=_AUDIO_PAYLOAD)
 
-    response = asyncio.run(_run())
     assert response.status_code == 200
     data = response.json()
     assert data["preview_ready"] is True
@@ -30,25 +18,19 @@ def test_ingest_audio_success() -> None:
     assert main.PENDING_INTERACTIONS[data["interaction_id"]] == data["preview"]
 
 
-def test_ingest_audio_provider_failure() -> None:
-    async def _run() -> httpx.Response:
-        with patch(
-            "logos.main.transcribe", new=Mock(side_effect=main.TranscriptionFailure("boom"))
-        ):
-            return await _post_audio({"source_uri": "file://audio.wav"})
+async def test_ingest_audio_provider_failure(asgi_client, monkeypatch) -> None:
+    def _fail(*args, **kwargs):
+        raise main.TranscriptionFailure("boom")
 
-    response = asyncio.run(_run())
-    assert response.status_code == 400
-    assert response.json() == {"detail": "boom"}
+    monkeypatch.setattr(main, "transcribe", _fail)
+    response = await asgi_client.post("/ingest/audio", json=_AUDIO_PAYLOAD)
 
-
-def test_ingest_audio_empty_payload() -> None:
-    response = asyncio.run(_post_audio({"source_uri": ""}))
     assert response.status_code == 400
-    assert response.json() == {"detail": "Source URI is required for transcription"}
+    assert response.json() == {"detail": "boom"}
 
 
-def test_ingest_audio_invalid_mime_type() -> None:
-    response = asyncio.run(_post_audio({}))
+@pytest.mark.parametrize("payload", [{"source_uri": ""}, {}], ids=["empty_source_uri", "missing_source_uri"])
+async def test_ingest_audio_requires_source_uri(asgi_client, payload) -> None:
+    response = await asgi_client.post("/ingest/audio", json=payload)
     assert response.status_code == 400
     assert response.json() == {"detail": "Source URI is required for transcription"}
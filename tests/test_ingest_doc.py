@@ -1,28 +1,17 @@
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
-import asyncio
-import httpx
+import pytest
 
 from logos import main
+from tests._helpers import json_of
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-def test_ingest_doc_extracts_entities() -> None:
-    text = "Jane Smith will send the report to Acme Pty Ltd by 2023-09-30."
 
-    async def _run() -> httpx.Response:
-        async with httpx.AsyncClient(
-            transport=httpx.ASGITransport(app=main.app), base_url="http://test"
-        ) as client:
-            return await client.post(
-                "/ingest/doc", json={"source_uri": "file://example", "text": text}
-            )
+async def test_ingest_doc_extracts_entities(asgi_client) -> None:
+    text = "Jane Smith will send the report to Acme Pty Ltd by 2023-09-30."
 
-    response = asyncio.run(_run())
+    response = await asgi_client.post("/ingest/doc", json={"source_uri": "file://example", "text": text})
     assert response.status_code == 200
-    data = response.json()
+    data = json_of(response)
     assert data["preview_ready"] is True
     preview = data["preview"]
     assert data["interaction_id"]
@@ -1,22 +1,21 @@
 from __future__ import annotations
 
-import pathlib
-import sys
+import orjson
+import pytest
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
-from fastapi.testclient import TestClient
-
-from logos import main
 from logos.api.routes import ingest as ingest_routes
+from tests._helpers import json_of
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 class DummyTx:
     def __init__(self) -> None:
-        self.calls: list[tuple[str, dict]] = []
+        # Only whether a MERGE was issued matters, so track that instead of logging every call.
+        self.saw_merge = False
 
     def run(self, cypher: str, params=None):
-        self.calls.append((cypher, params or {}))
+        self.saw_merge = self.saw_merge or "MERGE" in cypher
 
 
 class DummyClient:
@@ -27,30 +26,35 @@ class DummyClient:
         fn(self.tx)
 
 
-def test_ingest_preview_commit_round_trip(monkeypatch) -> None:
-    client = TestClient(main.app)
-    dummy_client = DummyClient()
-    monkeypatch.setattr(ingest_routes, "get_client", lambda: dummy_client)
+@pytest.fixture
+def dummy_client(dependency_overrides) -> DummyClient:
+    client = DummyClient()
+    dependency_overrides[ingest_routes.get_graph_client_factory] = lambda: lambda: client
+    return client
+
+
+async def test_ingest_preview_commit_round_trip(asgi_client, dummy_client) -> None:
 
-    ingest_response = client.post(
+    ingest_response = await asgi_client.post(
         "/api/v1/ingest/text",
         json={"text": "Jordan to deliver revised plan to Acme next week."},
     )
     assert ingest_response.status_code == 200
-    ingest_payload = ingest_response.json()
+    ingest_payload = json_of(ingest_response)
     interaction_id = ingest_payload["interaction_id"]
 
-    preview_response = client.get(f"/api/v1/interactions/{interaction_id}/preview")
+    preview_response = await asgi_client.get(f"/api/v1/interactions/{interaction_id}/preview")
     assert preview_response.status_code == 200
-    preview_payload = preview_response.json()
+    preview_payload = json_of(preview_response)
 
-    commit_response = client.post(
+    commit_response = await asgi_client.post(
         f"/api/v1/interactions/{interaction_id}/commit",
-        json=preview_payload,
+        content=orjson.dumps(preview_payload),
+        headers={"content-type": "application/json"},
     )
     assert commit_response.status_code == 200
-    commit_payload = commit_response.json()
+    commit_payload = json_of(commit_response)
 
     assert commit_payload["interaction_id"] == interaction_id
     assert commit_payload["status"] == "committed"
-    assert any("MERGE" in cypher for cypher, _ in dummy_client.tx.calls)
+    assert dummy_client.tx.saw_merge
@@ -2,13 +2,21 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import yaml
-
 from logos.core.pipeline_executor import PipelineContext, PipelineLoader, STAGE_REGISTRY, run_pipeline
 from logos.models.bundles import FeedbackBundle, InteractionMeta
+from tests._helpers import load_yaml
+
+
+_PIPELINES_YAML = b"""
+audit.commit.pipeline:
+  stages:
+    - test.commit.marker
+    - learn.capture_feedback
+    - S7_REFLECT_AND_LEARN
+"""
 
 
-def test_reflect_stage_runs_post_commit_with_feedback_bundle(tmp_path: Path) -> None:
+def test_reflect_stage_runs_post_commit_with_feedback_bundle(seeded_kb: Path, tmp_path: Path) -> None:
     @STAGE_REGISTRY.register("test.commit.marker")
     def _commit_marker(bundle: dict[str, object], ctx: PipelineContext) -> dict[str, object]:
         context = ctx.to_mapping()
@@ -17,31 +25,10 @@ def test_reflect_stage_runs_post_commit_with_feedback_bundle(tmp_path: Path) ->
         return bundle
 
     config_path = tmp_path / "pipelines.yml"
-    config_path.write_text(
-        """
-        audit.commit.pipeline:
-          stages:
-            - test.commit.marker
-            - learn.capture_feedback
-            - S7_REFLECT_AND_LEARN
-        """,
-        encoding="utf-8",
-    )
+    config_path.write_bytes(_PIPELINES_YAML)
 
-    kb_path = tmp_path / "kb"
+    kb_path = seeded_kb
     rules_path = kb_path / "rules" / "merge_thresholds.yml"
-    rules_path.parent.mkdir(parents=True, exist_ok=True)
-    rules_path.write_text(
-        """metadata:
-  version: \"0.0.1\"
-  updated_at: \"2024-01-01T00:00:00Z\"
-  updated_by: \"system\"
-
-defaults:
-  name_similarity: 0.8
-""",
-        encoding="utf-8",
-    )
 
     feedback_bundle = FeedbackBundle(
         meta=InteractionMeta(interaction_id="ix-123", interaction_type="note"),
@@ -79,8 +66,8 @@ defaults:
     assert "by Friday" in feedback_path.read_text(encoding="utf-8")
 
     lexicon_path = kb_path / "lexicons" / "obligation_phrases.yml"
-    lexicon_data = yaml.safe_load(lexicon_path.read_text(encoding="utf-8"))
+    lexicon_data = load_yaml(lexicon_path)
     assert any("friday" in str(pattern.get("regex", "")).lower() for pattern in lexicon_data["patterns"])
 
-    thresholds_data = yaml.safe_load(rules_path.read_text(encoding="utf-8"))
+    thresholds_data = load_yaml(rules_path)
     assert thresholds_data["defaults"]["name_similarity"] != 0.8
@@ -1,39 +1,23 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
-import yaml
+import orjson
 
 from logos.core.pipeline_executor import PipelineContext
 from logos.pipelines.interaction_commit import stage_reflect_and_learn
+from tests._helpers import load_yaml
 
 
 def _write_feedback(path: Path, entries: list[dict[str, object]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        for entry in entries:
-            handle.write(json.dumps(entry) + "\n")
+    path.write_bytes(b"".join(orjson.dumps(entry) + b"\n" for entry in entries))
 
 
-def test_reflect_and_learn_updates_knowledgebase(tmp_path: Path) -> None:
-    kb_path = tmp_path / "kb"
+def test_reflect_and_learn_updates_knowledgebase(seeded_kb: Path, tmp_path: Path) -> None:
+    kb_path = seeded_kb
     feedback_dir = tmp_path / "feedback"
-
     rules_path = kb_path / "rules" / "merge_thresholds.yml"
-    rules_path.parent.mkdir(parents=True, exist_ok=True)
-    rules_path.write_text(
-        """metadata:
-  version: "0.0.1"
-  updated_at: "2024-01-01T00:00:00Z"
-  updated_by: "system"
-
-defaults:
-  name_similarity: 0.8
-  org_similarity: 0.9
-""",
-        encoding="utf-8",
-    )
 
     feedback_entries = [
         {
@@ -70,17 +54,17 @@ defaults:
     stage_reflect_and_learn({"status": "ok"}, ctx)
 
     lexicon_path = kb_path / "lexicons" / "obligation_phrases.yml"
-    lexicon_data = yaml.safe_load(lexicon_path.read_text())
+    lexicon_data = load_yaml(lexicon_path)
     assert any(entry.get("regex") for entry in lexicon_data["patterns"])
 
     synonyms_path = kb_path / "lexicons" / "synonyms.yml"
-    synonyms_data = yaml.safe_load(synonyms_path.read_text())
+    synonyms_data = load_yaml(synonyms_path)
     assert any(entry.get("from") == "deliver report" for entry in synonyms_data["pairs"])
 
-    thresholds_data = yaml.safe_load(rules_path.read_text())
+    thresholds_data = load_yaml(rules_path)
     assert thresholds_data["defaults"]["name_similarity"] != 0.8
 
     signals_path = kb_path / "learning" / "signals.yml"
-    signals_data = yaml.safe_load(signals_path.read_text())
+    signals_data = load_yaml(signals_path)
     assert any(signal.get("type") == "concept_promotion_candidate" for signal in signals_data["signals"])
     assert any(signal.get("type") == "feedback_review" for signal in signals_data["signals"])
@@ -1,8 +1,7 @@
-import yaml
-
 from logos.knowledgebase.store import KnowledgebaseStore
 from logos.workflows.bundles import ExtractionBundle
 from logos.workflows.stages import sync_knowledgebase
+from tests._helpers import load_yaml
 
 
 def test_add_obligation_phrase_tracks_version_and_changelog(tmp_path):
@@ -17,11 +16,11 @@ def test_add_obligation_phrase_tracks_version_and_changelog(tmp_path):
 
     assert added is True
 
-    data = yaml.safe_load(lexicon_path.read_text())
+    data = load_yaml(lexicon_path)
     assert data["metadata"]["version"] == "0.0.1"
     assert any(entry.get("regex") for entry in data["patterns"])
 
-    changelog = yaml.safe_load((base / "versioning" / "changelog.yml").read_text())
+    changelog = load_yaml(base / "versioning" / "changelog.yml")
     assert changelog[-1]["path"] == "lexicons/obligation_phrases.yml"
 
 
@@ -42,7 +41,7 @@ def test_schema_updates_increment_version(tmp_path):
     assert added is True
 
     schema_path = base / "schema" / "node_types.yml"
-    data = yaml.safe_load(schema_path.read_text())
+    data = load_yaml(schema_path)
     assert data["metadata"]["version"] == "0.0.1"
     assert data["node_types"][0]["label"] == "CustomNode"
 
@@ -62,13 +61,13 @@ def test_apply_learning_signals_supports_sentiment_and_logging(tmp_path):
 
     assert "align with ESG" in updates["lexicon_updates"]
     assert "blocker" in updates["sentiment_updates"]
-    assert any(entry.get("label") == "Regulator" for entry in yaml.safe_load((base / "schema" / "node_types.yml").read_text())["node_types"])
+    assert any(entry.get("label") == "Regulator" for entry in load_yaml(base / "schema" / "node_types.yml")["node_types"])
 
     sentiment_path = base / "lexicons" / "sentiment_overrides.yml"
-    sentiment_data = yaml.safe_load(sentiment_path.read_text())
+    sentiment_data = load_yaml(sentiment_path)
     assert any(entry.get("term") == "blocker" for entry in sentiment_data["terms"])
 
-    learning_log = yaml.safe_load((base / "learning" / "signals.yml").read_text())
+    learning_log = load_yaml(base / "learning" / "signals.yml")
     assert any(entry.get("type") == "flagged_terms" for entry in learning_log["signals"])
 
 
@@ -92,7 +91,7 @@ def test_sync_stage_writes_through_updater(tmp_path):
     assert context["knowledgebase_updates"]["lexicon_updates"] == ["submit the report by Friday"]
 
     lexicon_path = base / "lexicons" / "obligation_phrases.yml"
-    data = yaml.safe_load(lexicon_path.read_text())
+    data = load_yaml(lexicon_path)
     assert any(entry.get("regex") for entry in data["patterns"])
 
 
@@ -121,10 +120,10 @@ def test_sync_stage_applies_learning_signals(tmp_path):
     assert updates["lexicon_updates"]
 
     sentiment_path = base / "lexicons" / "sentiment_overrides.yml"
-    sentiment_data = yaml.safe_load(sentiment_path.read_text())
+    sentiment_data = load_yaml(sentiment_path)
     assert any(entry.get("term") == "blocker" for entry in sentiment_data["terms"])
 
-    learning_log = yaml.safe_load((base / "learning" / "signals.yml").read_text())
+    learning_log = load_yaml(base / "learning" / "signals.yml")
     assert learning_log["signals"]
 
 
@@ -151,7 +150,7 @@ defaults:
 
     assert applied["name_similarity"] == 0.82
 
-    data = yaml.safe_load(rules_path.read_text())
+    data = load_yaml(rules_path)
     assert data["defaults"]["name_similarity"] == 0.82
 
 
@@ -179,6 +178,6 @@ defaults:
     assert applied["name_similarity"] == 1.0
     assert applied["org_similarity"] == 0.0
 
-    data = yaml.safe_load(rules_path.read_text())
+    data = load_yaml(rules_path)
     assert data["defaults"]["name_similarity"] == 1.0
     assert data["defaults"]["org_similarity"] == 0.0
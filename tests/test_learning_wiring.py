@@ -2,29 +2,13 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import yaml
-
 from logos.core.pipeline_executor import PipelineContext
 from logos.pipelines.interaction_commit import stage_reflect_and_learn
+from tests._helpers import load_yaml
 
 
-def _seed_minimal_kb(base_path: Path) -> None:
-    rules_path = base_path / "rules" / "merge_thresholds.yml"
-    rules_path.parent.mkdir(parents=True, exist_ok=True)
-    rules_path.write_text(
-        """metadata:
-  version: "0.0.1"
-defaults:
-  name_similarity: 0.8
-  org_similarity: 0.9
-""",
-        encoding="utf-8",
-    )
-
-
-def test_learning_hook_defaults_to_env_kb_path(monkeypatch, tmp_path: Path) -> None:
-    kb_path = tmp_path / "kb"
-    _seed_minimal_kb(kb_path)
+def test_learning_hook_defaults_to_env_kb_path(monkeypatch, seeded_kb: Path) -> None:
+    kb_path = seeded_kb
     monkeypatch.setenv("LOGOS_KB_DIR", str(kb_path))
 
     feedback_bundle = {
@@ -58,7 +42,7 @@ def test_learning_hook_defaults_to_env_kb_path(monkeypatch, tmp_path: Path) -> N
     stage_reflect_and_learn({"status": "ok"}, ctx)
 
     obligation_path = kb_path / "lexicons" / "obligation_phrases.yml"
-    data = yaml.safe_load(obligation_path.read_text(encoding="utf-8"))
+    data = load_yaml(obligation_path)
     assert any("Sept\\ 1" in str(entry.get("regex")) for entry in data["patterns"])
 
 
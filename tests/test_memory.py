@@ -1,12 +1,11 @@
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-import yaml
-
 from logos.memory import MemoryManager, load_memory_rules, update_memory_rules
 from logos.workflows import run_pipeline
 from logos.workflows.bundles import ExtractionBundle
 from logos.workflows.stages import build_preview_payload, capture_preview_memory, persist_session_memory
+from tests._helpers import load_yaml
 
 
 def test_memory_rules_are_loaded_from_knowledgebase():
@@ -99,7 +98,7 @@ def test_session_memory_persists_to_knowledgebase(tmp_path: Path):
 
     kb_file = tmp_path / "workflows" / "session_memory.yml"
     assert kb_file.exists()
-    data = yaml.safe_load(kb_file.read_text())
+    data = load_yaml(kb_file)
     assert data["sessions"]
 
 
@@ -119,7 +118,7 @@ agent_context:
         path=rules_path,
     )
 
-    persisted = yaml.safe_load(rules_path.read_text())
+    persisted = load_yaml(rules_path)
     assert persisted["short_term"]["default_ttl_seconds"] == 20
     assert persisted["agent_context"]["context_turn_limit"] == 3
     assert updated["agent_context"]["fallback_summary_max_words"] == 8
@@ -97,3 +97,21 @@ def test_get_model_for_raises_when_no_model_defined(monkeypatch, tmp_path) -> No
 
     with pytest.raises(ModelConfigError):
         model_tiers.get_model_for(TASK_ID)
+
+
+def test_get_task_tier_picks_up_rewritten_config_without_cache_clear(monkeypatch, tmp_path) -> None:
+    configure_tiers(monkeypatch, tmp_path, tier="rule_only")
+    assert model_tiers.get_task_tier(TASK_ID).tier == "rule_only"
+
+    (tmp_path / "tiers.yml").write_text(yaml.dump({"tasks": {TASK_ID: {"tier": "local_ml"}}}))
+
+    assert model_tiers.get_task_tier(TASK_ID).tier == "local_ml"
+
+
+def test_get_task_tier_reuses_parsed_map_until_config_changes(monkeypatch, tmp_path) -> None:
+    configure_tiers(monkeypatch, tmp_path, tier="rule_only")
+    first = model_tiers.get_task_tier(TASK_ID)
+    assert model_tiers.get_task_tier(TASK_ID) is first
+
+    model_tiers.clear_tier_cache()
+    assert model_tiers.get_task_tier(TASK_ID) is not first
@@ -1,7 +1,3 @@
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 from logos.graphio import neo4j_client
 
 
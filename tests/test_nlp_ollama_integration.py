@@ -28,6 +28,13 @@ def configure_extraction_tier(monkeypatch, tmp_path):
     return _configure
 
 
+@pytest.fixture
+def restore_obligation_patterns():
+    original_path = extract_mod.OBLIGATION_LEXICON_PATH
+    yield
+    extract_mod._refresh_obligation_patterns(original_path)
+
+
 def test_extract_all_uses_llm_when_configured(monkeypatch, configure_extraction_tier):
     configure_extraction_tier(tier="local_llm", fallback="rule_only")
 
@@ -135,7 +142,9 @@ def test_extract_all_falls_back_when_prompt_missing(monkeypatch, tmp_path, confi
     assert "Acme Pty Ltd" in result["entities"]["orgs"]
 
 
-def test_commitment_patterns_loaded_from_lexicon(monkeypatch, tmp_path, configure_extraction_tier):
+def test_commitment_patterns_loaded_from_lexicon(
+    monkeypatch, tmp_path, configure_extraction_tier, restore_obligation_patterns
+):
     configure_extraction_tier(tier="rule_only")
     lexicon = tmp_path / "obligation_phrases.yml"
     lexicon.write_text(
@@ -147,7 +156,6 @@ def test_commitment_patterns_loaded_from_lexicon(monkeypatch, tmp_path, configur
         encoding="utf-8",
     )
 
-    original_path = extract_mod.OBLIGATION_LEXICON_PATH
     monkeypatch.setattr(extract_mod, "OBLIGATION_LEXICON_PATH", lexicon)
 
     extract_mod._refresh_obligation_patterns()
@@ -157,4 +165,26 @@ def test_commitment_patterns_loaded_from_lexicon(monkeypatch, tmp_path, configur
 
     assert "obligated to deliver the new components by Monday" in result["entities"]["commitments"]
 
-    extract_mod._refresh_obligation_patterns(original_path)
+
+def test_commitment_patterns_keep_overlapping_and_backreference_matches(
+    monkeypatch, tmp_path, restore_obligation_patterns
+):
+    lexicon = tmp_path / "obligation_phrases.yml"
+    lexicon.write_text(
+        """patterns:
+  - regex: 'send\\ the\\ report'
+  - regex: 'the\\ report\\ to\\ Acme'
+  - regex: '(will|shall)\\ deliver'
+  - regex: '(\\w+)\\ and\\ \\1'
+""",
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(extract_mod, "OBLIGATION_LEXICON_PATH", lexicon)
+    extract_mod._refresh_obligation_patterns()
+
+    commitments = extract_mod._extract_entities(
+        "We will send the report to Acme. They will deliver, yes and yes."
+    )["commitments"]
+
+    assert commitments == ["send the report", "the report to Acme", "will", "yes"]
@@ -70,3 +70,12 @@ def test_build_agent_bundle_defaults():
     assert assists_rel.rel == "ASSISTS"
     assert assists_rel.src == agent.id
     assert assists_rel.dst == person.id
+
+
+def test_relationship_mappings_follow_rewritten_file(tmp_path):
+    rel_types_path = _write_relationship_types(tmp_path)
+    assert bundle._load_relationship_mappings(rel_types_path)["WORKS_FOR"] == "WORKS_FOR"
+
+    rel_types_path.write_text("relationship_types:\n  MENTORS:\n    aliases: [mentors]\n")
+
+    assert bundle._load_relationship_mappings(rel_types_path) == {"MENTORS": "MENTORS"}
@@ -4,11 +4,6 @@ from datetime import datetime, timezone
 
 import pytest
 
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from logos.core.ontology_guard import OntologyIntegrityError, OntologyIntegrityGuard
 from logos.core.pipeline_executor import PipelineContext, stage_graph_upsert
 from logos.graphio.schema_store import SchemaStore
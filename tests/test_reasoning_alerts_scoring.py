@@ -1,8 +1,3 @@
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from logos.core.pipeline_executor import PipelineContext
 from logos.pipelines.reasoning_alerts import compute_scores
 
@@ -7,6 +7,7 @@ import yaml
 
 from logos.knowledgebase.store import KnowledgebaseStore
 from logos.reasoning.path_policy import load_or_train_and_persist_policy
+from tests._helpers import load_yaml
 
 
 def _write_policy(path: Path, *, threshold: int) -> None:
@@ -76,7 +77,7 @@ def test_incremental_retraining_appends_reinforcement_log_and_archives_coefficie
     assert len(lines) == 2
     assert {line["outcome_label"] for line in lines} == {"materialised", "false_positive"}
 
-    persisted = yaml.safe_load(policy_path.read_text())
+    persisted = load_yaml(policy_path)
     archive = persisted["reasoning_policy"].get("coefficient_archive")
     assert isinstance(archive, list)
     assert archive[-1]["version"] == "1.0.0"
@@ -198,6 +199,6 @@ def test_record_alert_outcome_triggers_threshold_retraining_with_deterministic_s
     assert updated.version == "1.0.1"
     assert updated.coefficients["materialised"] != {"path_length": 0.1}
 
-    archive = yaml.safe_load(policy_path.read_text())["reasoning_policy"]["coefficient_archive"]
+    archive = load_yaml(policy_path)["reasoning_policy"]["coefficient_archive"]
     assert archive[-1]["version"] == "1.0.0"
     assert "changelog" in archive[-1]
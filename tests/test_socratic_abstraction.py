@@ -7,11 +7,6 @@ from pathlib import Path
 import pytest
 import yaml
 
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from logos.core.ontology_guard import OntologyIntegrityError, OntologyIntegrityGuard
 from logos.graphio.schema_store import SchemaStore
 from logos.graphio.upsert import GraphNode, GraphRelationship, InteractionBundle
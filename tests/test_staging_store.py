@@ -1,10 +1,6 @@
 import asyncio
-import pathlib
-import sys
 from datetime import datetime, timezone
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 import httpx
 import pytest
 
@@ -1,9 +1,5 @@
-import pathlib
-import sys
 from datetime import datetime, timezone
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from logos.normalise import build_interaction_bundle
 from logos.services.sync import build_graph_update_event
 
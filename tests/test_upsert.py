@@ -1,11 +1,5 @@
-import pathlib
-import sys
 from datetime import datetime, timezone
 
-import yaml
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from logos.graphio.schema_store import SchemaStore
 from logos.graphio.upsert import (
     GraphNode,
@@ -17,6 +11,7 @@ from logos.graphio.upsert import (
     upsert_relationship,
 )
 from logos.models.bundles import InteractionMeta, UpsertBundle
+from tests._helpers import load_yaml
 
 
 class FakeTx:
@@ -69,7 +64,7 @@ def test_upsert_node_records_schema_and_concept_link(tmp_path):
     assert params["id"] == "p1"
     concept_rel = next(call for call in tx.calls if "INSTANCE_OF" in call[0])
     assert concept_rel[1]["src"] == "p1"
-    node_types = yaml.safe_load((tmp_path / "node_types.yml").read_text())["node_types"]
+    node_types = load_yaml(tmp_path / "node_types.yml")["node_types"]
     assert "Person" in node_types
     assert node_types["Person"]["usage_count"] == 1
 
@@ -115,7 +110,7 @@ def test_upsert_relationship_accepts_dynamic_type(tmp_path):
     cypher, params = tx.calls[0]
     assert "COLLABORATES_WITH" in cypher
     assert params["src"] == "a1"
-    rel_types = yaml.safe_load((tmp_path / "relationship_types.yml").read_text())["relationship_types"]
+    rel_types = load_yaml(tmp_path / "relationship_types.yml")["relationship_types"]
     assert "COLLABORATES_WITH" in rel_types
     assert rel_types["COLLABORATES_WITH"]["usage_count"] == 1
 
@@ -178,7 +173,7 @@ def test_upsert_interaction_bundle_handles_dynamic_nodes(tmp_path):
     cypher_statements = [call[0] for call in tx.calls]
     assert any("Milestone" in stmt for stmt in cypher_statements)
     assert any("MENTIONS" in stmt for stmt in cypher_statements)
-    node_types = yaml.safe_load((tmp_path / "node_types.yml").read_text())["node_types"]
+    node_types = load_yaml(tmp_path / "node_types.yml")["node_types"]
     assert "Milestone" in node_types
 
 
@@ -266,3 +261,38 @@ def test_commit_upsert_bundle_materialises_dialectical_lines(monkeypatch, tmp_pa
     )
     assert rel_call["source_uri"] == "file://dialectic"
     assert result["dialectical_lines_committed"] == 1
+
+
+def test_schema_store_from_mapping_is_in_memory_and_read_only():
+    store = SchemaStore.from_mapping(
+        node_types={"node_types": {"Person": {"properties": ["name"], "concept_kind": "Stakeholder"}}},
+        relationship_types={"WORKS_FOR": {"properties": ["since"]}},
+        rules={"usage_deprecation": {"min_usage": 1}},
+        version={"version": 3},
+    )
+
+    assert store.node_types["Person"].properties == {"name"}
+    assert store.node_types["Person"].concept_kind == "Stakeholder"
+    assert store.relationship_types["WORKS_FOR"].properties == {"since"}
+    assert store.version == 3
+
+    store.record_node_type("Org", {"name"})
+
+    assert "Org" in store.node_types
+    assert store.version == 4
+
+
+def test_schema_store_from_mapping_mutable_persists_to_given_paths(tmp_path):
+    store = SchemaStore.from_mapping(
+        relationship_types={},
+        mutable=True,
+        node_types_path=tmp_path / "node_types.yml",
+        relationship_types_path=tmp_path / "relationship_types.yml",
+        version_path=tmp_path / "version.yml",
+    )
+
+    store.record_relationship_type("OWNS", {"since"})
+
+    persisted = load_yaml(tmp_path / "relationship_types.yml")
+    assert persisted["relationship_types"]["OWNS"]["properties"] == ["since"]
+    assert load_yaml(tmp_path / "version.yml")["version"] == 2
@@ -0,0 +1,18 @@
+from logos.yaml_cache import clear_yaml_cache, load_yaml_cached
+
+
+def test_load_yaml_cached_reuses_parse_until_file_changes(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text("tasks:\n  a: 1\n", encoding="utf-8")
+
+    first = load_yaml_cached(path)
+    assert load_yaml_cached(path) is first
+
+    path.write_text("tasks:\n  a: 1\n  b: 2\n", encoding="utf-8")
+    second = load_yaml_cached(path)
+    assert second == {"tasks": {"a": 1, "b": 2}}
+
+    clear_yaml_cache()
+    reparsed = load_yaml_cached(path)
+    assert reparsed == second
+    assert reparsed is not second